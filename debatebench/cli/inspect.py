@@ -2,21 +2,34 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Optional
 
 import typer
 
-from ..storage import load_debate_records
+from ..storage import stream_debate_records
 from .common import console
 
 
 def _find_latest_debates_file() -> Optional[Path]:
     results_dir = Path("results")
-    candidates = list(results_dir.glob("debates_*.jsonl"))
-    if candidates:
-        candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return candidates[0]
+    # scandir yields name and cached stat per entry; pick the newest without sorting.
+    try:
+        with os.scandir(results_dir) as it:
+            newest = max(
+                (
+                    e
+                    for e in it
+                    if e.name.startswith("debates_") and e.name.endswith(".jsonl") and e.is_file()
+                ),
+                key=lambda e: e.stat().st_mtime,
+                default=None,
+            )
+    except FileNotFoundError:
+        return None
+    if newest is not None:
+        return Path(newest.path)
     default = results_dir / "debates.jsonl"
     return default if default.exists() else None
 
@@ -43,21 +56,27 @@ def inspect_debate(
         if auto:
             path_in = auto
 
-    debates = load_debate_records(path_in)
-    if not debates:
-        console.print(f"[red]No debates found at {path_in}")
-        raise typer.Exit(code=1)
-
     record = None
-    if debate_id:
-        matches = [d for d in debates if d.transcript.debate_id == debate_id]
-        if matches:
-            record = matches[0]
-    else:
+    seen_any = False
+    for d in stream_debate_records(path_in):
+        seen_any = True
+        if debate_id:
+            if d.transcript.debate_id == debate_id:
+                record = d
+                break
+            continue
+        if record is None:
+            record = d
+            continue
         try:
-            record = max(debates, key=lambda d: d.created_at)
-        except Exception:
-            record = debates[-1] if debates else None
+            if d.created_at > record.created_at:
+                record = d
+        except TypeError:
+            # Incomparable timestamps: fall back to file order (last wins).
+            record = d
+    if not seen_any:
+        console.print(f"[red]No debates found at {path_in}")
+        raise typer.Exit(code=1)
 
     if record is None:
         console.print(f"[red]Debate {debate_id or ''} not found in {path_in}")
@@ -67,12 +86,20 @@ def inspect_debate(
     console.print(f"[bold]Debate {record.transcript.debate_id}[/bold]")
     console.print(f"Motion: {record.transcript.topic.motion}")
     console.print(f"Pro: {record.transcript.pro_model_id} | Con: {record.transcript.con_model_id}")
+    # One plain (no markup/highlighting) write per block: transcript text is model output and
+    # must not be parsed as Rich markup; "[pro]"/"[con]" labels would otherwise be swallowed.
     console.print("Transcript:")
-    for turn in record.transcript.turns:
-        console.print(f"  [{turn.speaker}] ({turn.stage}) {turn.content}")
+    console.out(
+        "\n".join(f"  [{turn.speaker}] ({turn.stage}) {turn.content}" for turn in record.transcript.turns),
+        highlight=False,
+    )
     console.print("Judges:")
-    for j in record.judges:
-        console.print(f"  {j.judge_id}: winner={j.winner}, pro={j.pro.scores}, con={j.con.scores}")
+    console.out(
+        "\n".join(
+            f"  {j.judge_id}: winner={j.winner}, pro={j.pro.scores}, con={j.con.scores}" for j in record.judges
+        ),
+        highlight=False,
+    )
     console.print(f"Aggregate winner: {record.aggregate.winner}")
 
 
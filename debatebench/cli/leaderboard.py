@@ -12,6 +12,10 @@ from ..storage import read_ratings
 from .common import console
 
 
+def _format_dim(val: Optional[float]) -> str:
+    return f"{val:.2f}" if val is not None else "-"
+
+
 def show_leaderboard(
     ratings_path: Path = typer.Option(
         Path("results/ratings.json"), help="Path to ratings file."
@@ -33,24 +37,19 @@ def show_leaderboard(
     table.add_column("Debates", justify="right")
 
     # Add per-dimension columns if present
-    dim_ids = set()
-    for _, entry in rows:
-        dim_ids.update(entry.dimension_avgs.keys())
-    dim_ids = sorted(dim_ids)
+    dim_ids = sorted({dim for _, entry in rows for dim in entry.dimension_avgs})
     for dim in dim_ids:
         table.add_column(dim, justify="right")
 
     for idx, (model_id, entry) in enumerate(rows, start=1):
-        cells = [
+        avgs = entry.dimension_avgs
+        table.add_row(
             str(idx),
             model_id,
             f"{entry.rating:.1f}",
             str(entry.games_played),
-        ]
-        for dim in dim_ids:
-            val = entry.dimension_avgs.get(dim)
-            cells.append(f"{val:.2f}" if val is not None else "-")
-        table.add_row(*cells)
+            *(_format_dim(avgs.get(dim)) for dim in dim_ids),
+        )
 
     console.print(table)
 
@@ -8,7 +8,7 @@ import typer
 
 from .. import config as cfg
 from ..rating import recompute_ratings
-from ..storage import load_debate_records, write_ratings
+from ..storage import stream_debate_records, write_ratings
 from .common import console
 
 
@@ -27,8 +27,7 @@ def rate_command(
     Recompute ratings from stored debates.
     """
     main_cfg = cfg.load_main_config(config_path)
-    debates = load_debate_records(debates_path)
-    ratings_file = recompute_ratings(debates, main_cfg)
+    ratings_file = recompute_ratings(stream_debate_records(debates_path), main_cfg)
     write_ratings(ratings_path, ratings_file)
     console.print(f"[green]Wrote ratings to {ratings_path}")
 
@@ -6,11 +6,6 @@ from typing import Optional
 
 import typer
 
-from .executor import execute_plan
-from .planner import build_plan
-from .postrun import run_postrun
-from .selection_flow import perform_selection
-from .setup import prepare_run
 from .types import RunOptions
 
 
@@ -70,6 +65,11 @@ def run_command(
     openrouter_months: int = typer.Option(
         4, help="Lookback window in months for OpenRouter model selection."
     ),
+    refresh_catalog: bool = typer.Option(
+        False,
+        "--refresh-catalog",
+        help="Ignore the cached OpenRouter model catalog (OPENROUTER_CATALOG_TTL, default 3600s) and fetch it again.",
+    ),
     openrouter_temperature: float = typer.Option(
         0.7,
         help="Temperature for OpenRouter-selected debaters (and quick-test config). Judges are forced to 0.0 in the adapter.",
@@ -174,6 +174,11 @@ def run_command(
         False,
         help="List uploads for --postupload without sending to S3.",
     ),
+    max_workers: Optional[int] = typer.Option(
+        None,
+        min=1,
+        help="Maximum debates in flight at once (default: min(64, 8 x CPU count)).",
+    ),
     estimate_time: bool = typer.Option(
         True,
         help="Estimate total wall-clock time using recent runs (median) and planned debate count.",
@@ -198,6 +203,7 @@ def run_command(
         balanced_judges=balanced_judges,
         openrouter_select=openrouter_select,
         openrouter_months=openrouter_months,
+        refresh_catalog=refresh_catalog,
         openrouter_temperature=openrouter_temperature,
         openrouter_max_tokens=openrouter_max_tokens,
         openrouter_probe=openrouter_probe,
@@ -224,8 +230,17 @@ def run_command(
         postupload_include_artifacts=postupload_include_artifacts,
         postupload_dry_run=postupload_dry_run,
         estimate_time=estimate_time,
+        max_workers=max_workers,
     )
 
+    # Imported here so other commands (and --help) don't load requests/rich.live and the
+    # rest of the run pipeline at CLI startup.
+    from .executor import execute_plan
+    from .planner import build_plan
+    from .postrun import run_postrun
+    from .selection_flow import perform_selection
+    from .setup import prepare_run
+
     setup = prepare_run(options)
     setup, final_debates_per_pair = perform_selection(setup)
     plan, dry_run_only = build_plan(setup, final_debates_per_pair)
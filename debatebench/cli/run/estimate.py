@@ -1,15 +1,19 @@
 """Time and cost estimation helpers for `debatebench run`."""
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
+import os
 import statistics
 import time
-from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Iterable, Any
+from typing import Dict, Optional, Tuple, Iterable, Iterator, Any
 
-import requests
+from pydantic_core import from_json
 
+from ...openrouter import CATALOG_CACHE_DIR, get_openrouter_session
 from ...storage import load_debate_records
 
 MIN_DEBATES_FOR_ESTIMATES = 120
@@ -23,22 +27,74 @@ def _count_jsonl_rows(path: Path) -> int:
         return 0
 
 
+def _newest_first(paths: Iterable[Path]) -> list[Path]:
+    """Order paths by mtime (newest first), stat()ing each once; files that vanish mid-scan are dropped."""
+    stamped = []
+    for p in paths:
+        try:
+            stamped.append((p.stat().st_mtime, p))
+        except OSError:
+            continue
+    stamped.sort(key=lambda item: item[0], reverse=True)
+    return [p for _, p in stamped]
+
+
+def _scan_results(results_dir: Path, prefix: str, suffix: str) -> list[os.DirEntry]:
+    """Files directly under `results_dir` named `<prefix>*<suffix>`, from one scandir pass."""
+    try:
+        with os.scandir(results_dir) as it:
+            return [
+                e for e in it if e.name.startswith(prefix) and e.name.endswith(suffix) and e.is_file()
+            ]
+    except OSError:
+        return []
+
+
+def _iter_newest_files(results_dir: Path, prefix: str, suffix: str) -> Iterator[Path]:
+    """
+    Yield matching files newest-first. Heapified rather than sorted: callers usually stop
+    at the first file with enough rows, so only the files actually visited pay a pop.
+    """
+    heap = []
+    for idx, entry in enumerate(_scan_results(results_dir, prefix, suffix)):
+        try:
+            heap.append((-entry.stat().st_mtime, idx, entry.path))
+        except OSError:
+            continue
+    heapq.heapify(heap)
+    while heap:
+        yield Path(heapq.heappop(heap)[2])
+
+
 def format_duration(seconds: float) -> str:
     """Pretty-print seconds as human-friendly duration."""
     if seconds < 1:
         return f"{seconds*1000:.0f} ms"
-    delta = timedelta(seconds=int(seconds))
-    hours, remainder = divmod(delta.seconds, 3600)
+    days, remainder = divmod(int(seconds), 86400)
+    hours, remainder = divmod(remainder, 3600)
     minutes, secs = divmod(remainder, 60)
-    parts = []
-    if delta.days:
-        parts.append(f"{delta.days}d")
-    if hours or delta.days:
-        parts.append(f"{hours}h")
-    if minutes or hours or delta.days:
-        parts.append(f"{minutes}m")
-    parts.append(f"{secs}s")
-    return " ".join(parts)
+    if days:
+        return f"{days}d {hours}h {minutes}m {secs}s"
+    if hours:
+        return f"{hours}h {minutes}m {secs}s"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
+def _iter_debate_seconds(path: Path) -> Iterator[float]:
+    """
+    Yield sum(turn.duration_ms) + sum(judge.latency_ms), in seconds, per record.
+    Plucks the two timing fields from raw JSON instead of validating full DebateRecords.
+    """
+    with path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            turn_ms = sum(t.get("duration_ms") or 0 for t in rec["transcript"]["turns"])
+            judge_ms = sum(j.get("latency_ms") or 0 for j in rec["judges"])
+            yield (turn_ms + judge_ms) / 1000.0
 
 
 def historical_debate_durations(
@@ -52,24 +108,21 @@ def historical_debate_durations(
     Total seconds = sum(turn.duration_ms) + sum(judge.latency_ms) for each debate.
     """
     totals = []
-    files = sorted(results_dir.glob("debates_*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
     processed_files = 0
-    for path in files:
+    for path in _iter_newest_files(results_dir, "debates_", ".jsonl"):
         if _count_jsonl_rows(path) < min_debates:
             continue
+        file_totals = []
         try:
-            records = load_debate_records(path)
-        except Exception:
+            for seconds in _iter_debate_seconds(path):
+                if seconds > 0:
+                    file_totals.append(seconds)
+                    if len(totals) + len(file_totals) >= max_records:
+                        break
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
             continue
         processed_files += 1
-        for rec in records:
-            turn_ms = sum(t.duration_ms or 0 for t in rec.transcript.turns)
-            judge_ms = sum(j.latency_ms or 0 for j in rec.judges)
-            total_ms = turn_ms + judge_ms
-            if total_ms > 0:
-                totals.append(total_ms / 1000.0)
-            if len(totals) >= max_records:
-                break
+        totals.extend(file_totals)
         if len(totals) >= max_records:
             break
         if processed_files >= max_files:
@@ -161,7 +214,7 @@ def write_timing_snapshot(
 def load_timing_snapshots(
     results_dir: Path, max_files: int = 10, min_debates: int = MIN_DEBATES_FOR_ESTIMATES
 ) -> list[Dict[str, Any]]:
-    snapshots = sorted(results_dir.glob("run_*/timing_snapshot.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    snapshots = _newest_first(results_dir.glob("run_*/timing_snapshot.json"))
     out = []
     for path in snapshots[:max_files]:
         try:
@@ -281,32 +334,83 @@ def estimate_wall_time(
     return estimates, meta
 
 
-def fetch_pricing(models_needed: set[str], settings) -> Dict[str, Tuple[float, float]]:
+def _pricing_cache_path(api_key: str) -> Path:
+    key_hash = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+    return CATALOG_CACHE_DIR / f"openrouter_pricing_{key_hash}.json"
+
+
+def _read_pricing_cache(path: Path) -> Tuple[Optional[Dict[str, Tuple[float, float]]], Optional[str], float]:
+    """Return (prices, etag, age_seconds) from the pricing cache, or (None, None, inf)."""
+    try:
+        age = time.time() - path.stat().st_mtime
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        prices = {mid: (float(p), float(c)) for mid, (p, c) in raw["prices"].items()}
+        return prices, raw.get("etag"), age
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None, None, float("inf")
+
+
+def _write_pricing_cache(path: Path, pricing: Dict[str, Tuple[float, float]], etag: Optional[str]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"etag": etag, "prices": pricing}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # cache is best-effort
+
+
+def fetch_pricing(models_needed: set[str], settings, refresh: bool = False) -> Dict[str, Tuple[float, float]]:
     """
     Returns map model_id -> (prompt_price_per_token, completion_price_per_token) by hitting OpenRouter.
-    Falls back to an empty mapping if the API fails; caller should handle missing entries.
+    If the API fails, falls back to the cached prices (even if stale), else an empty
+    mapping; caller should handle missing entries.
+    Prices for the whole catalog are cached on disk for `settings.openrouter_catalog_ttl`
+    seconds (same knob as the model catalog); `refresh=True` forces a fetch. Once the
+    cache is stale it is revalidated with the stored ETag, so an unchanged catalog costs
+    a 304 instead of a full download.
     """
+    ttl_s = settings.openrouter_catalog_ttl
+    cache_path = _pricing_cache_path(settings.openrouter_api_key)
+    cached, etag, age = _read_pricing_cache(cache_path) if ttl_s > 0 else (None, None, 0.0)
+    if cached is not None and not refresh and age < ttl_s:
+        return {mid: rates for mid, rates in cached.items() if mid in models_needed}
+
     pricing: Dict[str, Tuple[float, float]] = {}
     headers = {"Authorization": f"Bearer {settings.openrouter_api_key}", "Accept": "application/json"}
     if settings.openrouter_site_url:
         headers["HTTP-Referer"] = settings.openrouter_site_url
     if settings.openrouter_site_name:
         headers["X-Title"] = settings.openrouter_site_name
+    if cached is not None and etag:
+        headers["If-None-Match"] = etag
     try:
-        resp = requests.get("https://openrouter.ai/api/v1/models", headers=headers, timeout=30)
+        resp = get_openrouter_session().get("https://openrouter.ai/api/v1/models", headers=headers, timeout=30)
+        if resp.status_code == 304 and cached is not None:
+            try:
+                os.utime(cache_path)  # still current: restart the TTL without rewriting
+            except OSError:
+                pass
+            return {mid: rates for mid, rates in cached.items() if mid in models_needed}
         resp.raise_for_status()
         payload = resp.json().get("data", [])
         for entry in payload:
             mid = entry.get("id")
-            if mid in models_needed:
-                pr = entry.get("pricing") or {}
-                p = float(pr.get("prompt")) if pr.get("prompt") not in (None, "") else None
-                c = float(pr.get("completion")) if pr.get("completion") not in (None, "") else None
-                if p is not None and c is not None:
-                    pricing[mid] = (p, c)
+            if not mid:
+                continue
+            pr = entry.get("pricing") or {}
+            p = float(pr.get("prompt")) if pr.get("prompt") not in (None, "") else None
+            c = float(pr.get("completion")) if pr.get("completion") not in (None, "") else None
+            if p is not None and c is not None:
+                pricing[mid] = (p, c)
     except Exception:
-        return {}
-    return pricing
+        if cached is None:
+            return {}
+        # Stale prices beat an empty estimate.
+        return {mid: rates for mid, rates in cached.items() if mid in models_needed}
+    if ttl_s > 0:
+        _write_pricing_cache(cache_path, pricing, resp.headers.get("ETag"))
+    return {mid: rates for mid, rates in pricing.items() if mid in models_needed}
 
 
 def load_activity_pricing(activity_path: Optional[Path] = None) -> Tuple[Dict[str, Tuple[float, float]], Optional[Path]]:
@@ -315,20 +419,34 @@ def load_activity_pricing(activity_path: Optional[Path] = None) -> Tuple[Dict[st
     Uses a blended rate: usage / (prompt+completion+reasoning tokens).
     """
     if activity_path is None:
-        candidates = sorted(Path("results").glob("openrouter_activity_*.json"))
-        if not candidates:
+        # Activity exports are date-stamped, so the lexically greatest name is the latest.
+        newest = max(
+            (e.name for e in _scan_results(Path("results"), "openrouter_activity_", ".json")),
+            default=None,
+        )
+        if newest is None:
             return {}, None
-        activity_path = candidates[-1]
-    if not activity_path.exists():
+        activity_path = Path("results") / newest
+    try:
+        mtime_ns = activity_path.stat().st_mtime_ns
+    except OSError:
         return {}, None
+    pricing = _activity_rates(str(activity_path), mtime_ns)
+    if pricing is None:
+        return {}, None
+    return dict(pricing), activity_path
+
 
+@lru_cache(maxsize=4)
+def _activity_rates(path: str, mtime_ns: int) -> Optional[Dict[str, Tuple[float, float]]]:
+    # Keyed by mtime so an overwritten activity export is re-aggregated; callers get a copy.
     try:
-        raw = json.loads(activity_path.read_text())
+        raw = json.loads(Path(path).read_text())
         records = raw.get("data") if isinstance(raw, dict) else raw
     except Exception:
-        return {}, None
+        return None
     if not isinstance(records, list):
-        return {}, None
+        return None
 
     agg: Dict[str, Dict[str, float]] = {}
     for rec in records:
@@ -355,7 +473,17 @@ def load_activity_pricing(activity_path: Optional[Path] = None) -> Tuple[Dict[st
             continue
         rate = vals["usage"] / total_tokens
         pricing[model] = (rate, rate)
-    return pricing, activity_path
+    return pricing
+
+
+def _low_and_median(vals: list[float], p: float) -> Tuple[float, float]:
+    """Nearest-rank `p` percentile and the median of `vals`, from a single sort."""
+    s = sorted(vals)
+    k = len(s)
+    low = s[min(k - 1, max(0, int(round(p * (k - 1)))))]
+    mid = k // 2
+    med = s[mid] if k % 2 else 0.5 * (s[mid - 1] + s[mid])
+    return low, med
 
 
 def load_token_stats(debates_path: Optional[Path] = None, min_debates: int = MIN_DEBATES_FOR_ESTIMATES):
@@ -367,100 +495,79 @@ def load_token_stats(debates_path: Optional[Path] = None, min_debates: int = MIN
     judge_stats: judge_id -> {"prompt_avg": float, "completion_avg": float}
     """
     if debates_path is None:
-        candidates = sorted(Path("results").glob("debates_*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
         debates_path = None
-        for candidate in candidates:
+        for candidate in _iter_newest_files(Path("results"), "debates_", ".jsonl"):
             if _count_jsonl_rows(candidate) >= min_debates:
                 debates_path = candidate
                 break
         if debates_path is None:
             return {}, {}, None
 
-    debater_totals: Dict[str, Dict[str, float]] = {}
-    debater_counts: Dict[str, int] = {}
-    judge_totals: Dict[str, Dict[str, float]] = {}
-    judge_counts: Dict[str, int] = {}
+    # Per-id running [prompt_sum, completion_sum, count]: one dict probe per turn/judge.
+    debater_totals: Dict[str, list] = {}
+    judge_totals: Dict[str, list] = {}
     judge_samples: Dict[str, Dict[str, list[float]]] = {}
 
     try:
-        with debates_path.open() as f:
+        # Raw bytes through pydantic's Rust JSON parser; only token fields are read.
+        with debates_path.open("rb") as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                if not line.strip():
                     continue
-                rec = json.loads(line)
+                rec = from_json(line)
                 tr = rec.get("transcript") or {}
+                pro_id = tr.get("pro_model_id")
+                con_id = tr.get("con_model_id")
                 for turn in tr.get("turns", []):
                     pt = turn.get("prompt_tokens")
                     ct = turn.get("completion_tokens")
                     if pt is None or ct is None:
                         continue
-                    speaker = turn.get("speaker")
-                    mid = tr.get("pro_model_id") if speaker == "pro" else tr.get("con_model_id")
+                    mid = pro_id if turn.get("speaker") == "pro" else con_id
                     if not mid:
                         continue
-                    agg = debater_totals.setdefault(mid, {"pt": 0.0, "ct": 0.0})
-                    agg["pt"] += pt
-                    agg["ct"] += ct
-                    debater_counts[mid] = debater_counts.get(mid, 0) + 1
+                    agg = debater_totals.get(mid)
+                    if agg is None:
+                        debater_totals[mid] = [0.0 + pt, 0.0 + ct, 1]
+                    else:
+                        agg[0] += pt
+                        agg[1] += ct
+                        agg[2] += 1
                 for jres in rec.get("judges", []):
                     pid = jres.get("judge_id")
                     pt = jres.get("prompt_tokens")
                     ct = jres.get("completion_tokens")
                     if pid is None or pt is None or ct is None:
                         continue
-                    agg = judge_totals.setdefault(pid, {"pt": 0.0, "ct": 0.0})
-                    agg["pt"] += pt
-                    agg["ct"] += ct
-                    judge_counts[pid] = judge_counts.get(pid, 0) + 1
-                    samples = judge_samples.setdefault(pid, {"pt": [], "ct": []})
-                    samples["pt"].append(pt)
-                    samples["ct"].append(ct)
+                    agg = judge_totals.get(pid)
+                    if agg is None:
+                        judge_totals[pid] = [0.0 + pt, 0.0 + ct, 1]
+                        judge_samples[pid] = {"pt": [pt], "ct": [ct]}
+                    else:
+                        agg[0] += pt
+                        agg[1] += ct
+                        agg[2] += 1
+                        samples = judge_samples[pid]
+                        samples["pt"].append(pt)
+                        samples["ct"].append(ct)
     except Exception:
         return {}, {}, None
 
     debater_stats = {}
-    for mid, totals in debater_totals.items():
-        n = debater_counts.get(mid, 0)
-        if n:
-            debater_stats[mid] = {
-                "prompt_avg": totals["pt"] / n,
-                "completion_avg": totals["ct"] / n,
-            }
+    for mid, (pt_sum, ct_sum, n) in debater_totals.items():
+        debater_stats[mid] = {
+            "prompt_avg": pt_sum / n,
+            "completion_avg": ct_sum / n,
+        }
     judge_stats = {}
-    for pid, totals in judge_totals.items():
-        n = judge_counts.get(pid, 0)
-        if n:
-            def pct(vals: list[float], p: float) -> float:
-                if not vals:
-                    return 0.0
-                s = sorted(vals)
-                if len(s) == 1:
-                    return s[0]
-                idx = min(len(s) - 1, max(0, int(round(p * (len(s) - 1)))))
-                return s[idx]
-
-            def median(vals: list[float]) -> float:
-                if not vals:
-                    return 0.0
-                s = sorted(vals)
-                k = len(s)
-                mid = k // 2
-                if k % 2:
-                    return s[mid]
-                return 0.5 * (s[mid - 1] + s[mid])
-
-            samples = judge_samples.get(pid, {"pt": [], "ct": []})
-            prompt_raw = pct(samples.get("pt", []), 0.10) if samples.get("pt") else totals["pt"] / n
-            completion_raw = pct(samples.get("ct", []), 0.10) if samples.get("ct") else totals["ct"] / n
-            prompt_med = median(samples.get("pt", [])) if samples.get("pt") else prompt_raw
-            completion_med = median(samples.get("ct", [])) if samples.get("ct") else completion_raw
-            prompt_capped = min(prompt_raw, prompt_med, 1500.0)
-            completion_capped = min(completion_raw, completion_med, 250.0)
-            judge_stats[pid] = {
-                "prompt_avg": prompt_capped,
-                "completion_avg": completion_capped,
-            }
+    for pid, (pt_sum, ct_sum, n) in judge_totals.items():
+        samples = judge_samples[pid]
+        prompt_raw, prompt_med = _low_and_median(samples["pt"], 0.10)
+        completion_raw, completion_med = _low_and_median(samples["ct"], 0.10)
+        judge_stats[pid] = {
+            "prompt_avg": min(prompt_raw, prompt_med, 1500.0),
+            "completion_avg": min(completion_raw, completion_med, 250.0),
+        }
     return debater_stats, judge_stats, debates_path
 
 
@@ -482,8 +589,10 @@ def estimate_cost(
         approximated as completion_total + (completion_total - first_turn_tokens)
       - Judge: prompt tokens = sum(token_limit for all turns); completion ~200 tokens JSON
     """
-    models_needed = {m.model for m in debaters} | {j.model for j in judges}
     pricing = pricing_override or {}
+    if not pricing:
+        # Nothing can be priced (e.g. the catalog fetch failed); every model would be skipped.
+        return 0.0, {}, 0.0, {}
 
     def side_token_budget():
         limits = [r.token_limit for r in rounds if r.speaker == "pro"]
@@ -503,20 +612,28 @@ def estimate_cost(
     per_model_cost: Dict[str, float] = {}
     total_debater_cost = 0.0
     debates_per_pair_total = debates_per_pair * num_topics
+    # A debater's per-debate cost does not depend on its opponent, so price each model
+    # once and scale by the number of pairs it appears in.
+    appearances: Dict[str, int] = {}
+    models_by_id = {}
     for a, b in pairs:
-        for model, tokens in ((a, (prompt_side, comp_side)), (b, (prompt_side, comp_side))):
-            if model.id in debater_stats:
-                prompt_tokens = debater_stats[model.id]["prompt_avg"] * turns_per_side
-                comp_tokens = debater_stats[model.id]["completion_avg"] * turns_per_side
-            else:
-                prompt_tokens, comp_tokens = tokens
-            rates = pricing.get(model.model)
-            if not rates:
-                continue
-            p_rate, c_rate = rates
-            cost = prompt_tokens * p_rate + comp_tokens * c_rate
-            per_model_cost[model.id] = per_model_cost.get(model.id, 0.0) + cost * debates_per_pair_total
-            total_debater_cost += cost * debates_per_pair_total
+        for model in (a, b):
+            appearances[model.id] = appearances.get(model.id, 0) + 1
+            models_by_id.setdefault(model.id, model)
+    for mid, n_pairs in appearances.items():
+        model = models_by_id[mid]
+        rates = pricing.get(model.model)
+        if not rates:
+            continue
+        if mid in debater_stats:
+            prompt_tokens = debater_stats[mid]["prompt_avg"] * turns_per_side
+            comp_tokens = debater_stats[mid]["completion_avg"] * turns_per_side
+        else:
+            prompt_tokens, comp_tokens = prompt_side, comp_side
+        p_rate, c_rate = rates
+        cost = (prompt_tokens * p_rate + comp_tokens * c_rate) * debates_per_pair_total * n_pairs
+        per_model_cost[mid] = cost
+        total_debater_cost += cost
 
     transcript_tokens = sum(r.token_limit for r in rounds if isinstance(r.token_limit, (int, float)))
     judge_output_tokens = 200
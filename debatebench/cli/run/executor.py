@@ -7,7 +7,9 @@ import signal
 import threading
 import queue
 import time
+from collections import deque
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from rich.progress import (
@@ -30,12 +32,24 @@ from ...models import (
     configure_openrouter_rate_limit,
     get_openrouter_rate_limit_status,
 )
+from ...openrouter import configure_openrouter_pool
 from ...schema import DebateRecord
-from ...storage import append_debate_record
+from ...storage import BatchedJsonlWriter, JsonlAppender
 from ..common import console
+from .setup import resolve_max_workers
 from .types import RunPlan, RunSetup
 
 
+@lru_cache(maxsize=None)
+def _progress_bar(current: int, total: int, width: int = 10) -> str:
+    # Few distinct (round, total) pairs occur per run, so the bars are built once.
+    if total <= 0:
+        return "-" * width
+    filled = int(round(width * (current / total)))
+    filled = max(0, min(width, filled))
+    return "[" + ("█" * filled) + ("░" * (width - filled)) + "]"
+
+
 def _run_debate_and_judge(
     setup: RunSetup,
     topic,
@@ -46,7 +60,7 @@ def _run_debate_and_judge(
     judge_adapters,
     panel_configs,
     remaining_candidates,
-    failed_judges_path,
+    failed_judges_log,
     log,
     status_hook=None,
     progress_hook=None,
@@ -68,8 +82,8 @@ def _run_debate_and_judge(
     if status_hook:
         status_hook(phase="judging")
 
-    panel_adapters = [judge_adapters[j.id] for j in panel_configs]
-    remaining_adapters = [judge_adapters[j.id] for j in remaining_candidates]
+    # Panel first, then fallbacks, in one list (run_judge_panel consumes them in order).
+    candidate_adapters = [judge_adapters[j.id] for j in (*panel_configs, *remaining_candidates)]
 
     if log:
         log(f"  Judging with panel: {', '.join(j.id for j in panel_configs)}")
@@ -78,37 +92,35 @@ def _run_debate_and_judge(
     usage_ordering.update({cfg.id: 1 for cfg in remaining_candidates})
 
     def sink_failed(payload):
-        if not failed_judges_path:
-            return
-        failed_judges_path.parent.mkdir(parents=True, exist_ok=True)
-        with failed_judges_path.open("a", encoding="utf-8") as f:
-            f.write(
-                json.dumps(
-                    {
-                        **payload,
-                        "debate_id": transcript.debate_id,
-                        "topic": topic.id,
-                        "pro": pro_model.id,
-                        "con": con_model.id,
-                        "created_at": datetime.now(timezone.utc).isoformat(),
-                    }
-                )
-            )
-            f.write("\n")
+        failed_judges_log.append(
+            {
+                **payload,
+                "debate_id": transcript.debate_id,
+                "topic": topic.id,
+                "pro": pro_model.id,
+                "con": con_model.id,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
 
     judge_results, aggregate = run_judge_panel(
-        candidate_adapters=panel_adapters + remaining_adapters,
+        candidate_adapters=candidate_adapters,
         transcript=transcript,
         config=main_cfg,
         expected=main_cfg.num_judges,
         usage=usage_ordering,
         seed=debate_seed,
         log=log,
-        failed_judges_sink=sink_failed if failed_judges_path else None,
+        failed_judges_sink=sink_failed if failed_judges_log else None,
         progress_hook=judge_hook,
     )
 
-    panel_latency = sum(j.latency_ms for j in judge_results if j.latency_ms is not None)
+    judges_actual = 0
+    panel_latency = 0
+    for judge_result in judge_results:
+        judges_actual += 1
+        if judge_result.latency_ms is not None:
+            panel_latency += judge_result.latency_ms
 
     record = DebateRecord(
         transcript=transcript,
@@ -116,8 +128,8 @@ def _run_debate_and_judge(
         aggregate=aggregate,
         created_at=datetime.now(timezone.utc),
         judges_expected=main_cfg.num_judges,
-        judges_actual=len(judge_results),
-        panel_complete=len(judge_results) == main_cfg.num_judges,
+        judges_actual=judges_actual,
+        panel_complete=judges_actual == main_cfg.num_judges,
         panel_latency_ms=panel_latency,
         debate_seed=debate_seed,
         elo=main_cfg.elo,
@@ -145,7 +157,10 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
     existing_completed = plan.existing_completed
 
     progress_path = plan.progress_path or (setup.run_dir / "progress.json")
-    failed_judges_path = setup.run_dir / "failed_judges.jsonl" if opts.log_failed_judges else None
+    # Shared by all worker threads; opened lazily so the file only appears if a judge fails.
+    failed_judges_log = (
+        JsonlAppender(setup.run_dir / "failed_judges.jsonl") if opts.log_failed_judges else None
+    )
 
     banned_models = set()
     failed_debates: List = []
@@ -161,8 +176,14 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
     status_queue: queue.Queue[tuple] = queue.Queue()
     refresh_interval = 0.25
     last_refresh = time.monotonic()
+    # progress.json is rewritten at most this often while debates stream in;
+    # bans and shutdown always write immediately.
+    progress_interval = 1.0
+    last_progress_write = 0.0
+    progress_dirty = False
 
     def write_progress():
+        nonlocal last_progress_write, progress_dirty
         payload = {
             "run_tag": setup.run_tag,
             "debates_file": str(setup.debates_path),
@@ -174,11 +195,24 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
             "banned_models": sorted(banned_models),
         }
         progress_path.parent.mkdir(parents=True, exist_ok=True)
-        with progress_path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        # Write-then-rename so anyone polling progress.json never sees a half-written file.
+        tmp_path = progress_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp_path, progress_path)
+        last_progress_write = time.monotonic()
+        progress_dirty = False
+
+    def maybe_write_progress() -> None:
+        nonlocal progress_dirty
+        progress_dirty = True
+        if time.monotonic() - last_progress_write >= progress_interval:
+            write_progress()
 
     write_progress()
-    max_workers = min(64, (os.cpu_count() or 4) * 8)
+    max_workers = resolve_max_workers(setup.options)
+    # Each in-flight debate makes one call at a time while debating, then num_judges
+    # concurrent calls while judging; keep one pooled connection per possible request.
+    configure_openrouter_pool(max_workers * max(1, main_cfg.num_judges))
     progress = Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -199,13 +233,6 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
             ),
         )
 
-    def _progress_bar(current: int, total: int, width: int = 10) -> str:
-        if total <= 0:
-            return "-" * width
-        filled = int(round(width * (current / total)))
-        filled = max(0, min(width, filled))
-        return "[" + ("█" * filled) + ("░" * (width - filled)) + "]"
-
     def _update_status(task_id: str, **updates) -> None:
         with status_lock:
             entry = task_status.setdefault(
@@ -300,22 +327,12 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
         if not inflight:
             table.add_row("-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-", "-")
         else:
+            now = time.monotonic()
+            queued_status = {"phase": "queued", "last_update": now}
             for idx, (_, meta) in enumerate(inflight.items(), start=1):
                 task, _attempt_seed, _task_index, _start_time = meta
                 with status_lock:
-                    status = task_status.get(
-                        task.task_id,
-                        {
-                            "round": 0,
-                            "stage": "-",
-                            "phase": "queued",
-                            "error": "",
-                            "last_update": time.monotonic(),
-                            "judges_done": 0,
-                            "judges_expected": main_cfg.num_judges,
-                            "retrying": False,
-                        },
-                    )
+                    status = task_status.get(task.task_id, queued_status)
                 round_idx = status.get("round", 0)
                 stage = status.get("stage", "-")
                 phase = status.get("phase", "queued")
@@ -323,7 +340,7 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
                 retrying = status.get("retrying", False)
                 judges_done = status.get("judges_done", 0)
                 judges_expected = status.get("judges_expected", main_cfg.num_judges)
-                age = time.monotonic() - status.get("last_update", time.monotonic())
+                age = now - status.get("last_update", now)
                 judges_label = "-" if phase != "judging" else f"{judges_done}/{judges_expected}"
                 progress_bar = _progress_bar(round_idx, total_steps)
                 table.add_row(
@@ -353,7 +370,7 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
             judge_adapters=judge_adapters,
             panel_configs=task.panel_configs,
             remaining_candidates=task.remaining_candidates,
-            failed_judges_path=failed_judges_path,
+            failed_judges_log=failed_judges_log,
             log=log_fn,
             status_hook=status_hook,
             progress_hook=progress_hook,
@@ -361,9 +378,9 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
         )
         return record, aggregate
 
-    def submit_tasks(task_list, retry_offset: int = 0, live: Live | None = None):
+    def submit_tasks(task_list, writer: BatchedJsonlWriter, retry_offset: int = 0, live: Live | None = None):
         nonlocal completed_new, run_index, failed_debates, failed_total, skipped_total
-        queue_tasks = list(task_list)
+        queue_tasks = deque(task_list)
         inflight = {}
 
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
@@ -376,14 +393,8 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
                     while queue_tasks and len(inflight) < max_workers:
                         if stop_requested.is_set():
                             raise KeyboardInterrupt
-                        task = queue_tasks.pop(0)
+                        task = queue_tasks.popleft()
                         attempts += 1
-                        if task.pro_model.id in banned_models or task.con_model.id in banned_models:
-                            skipped_total += 1
-                            progress.advance(progress_task, 1)
-                            update_progress(active_count=len(inflight))
-                            maybe_update(live, inflight)
-                            continue
                         run_index += 1
                         task_index = run_index
                         attempt_seed = task.seed + retry_offset
@@ -434,15 +445,18 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
 
                     done, _ = wait(inflight.keys(), return_when=FIRST_COMPLETED, timeout=0.2)
                     if not done:
+                        writer.flush_if_due()
+                        if progress_dirty:
+                            maybe_write_progress()
                         continue
                     for future in done:
                         task, attempt_seed, task_index, start_time = inflight.pop(future)
                         try:
                             record, aggregate = future.result()
-                            append_debate_record(setup.debates_path, record)
+                            writer.write(record)
                             completed_new += 1
                             progress.advance(progress_task, 1)
-                            write_progress()
+                            maybe_write_progress()
                             update_progress(active_count=len(inflight))
                             _update_status(task.task_id, phase="done")
                             maybe_update(live, inflight)
@@ -456,6 +470,18 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
                                 )
                             if opts.skip_on_empty:
                                 banned_models.add(e.model_id)
+                                # Drop the banned model's queued debates once instead of testing every pop.
+                                active_tasks = deque(
+                                    t
+                                    for t in queue_tasks
+                                    if t.pro_model.id not in banned_models and t.con_model.id not in banned_models
+                                )
+                                dropped = len(queue_tasks) - len(active_tasks)
+                                if dropped:
+                                    queue_tasks = active_tasks
+                                    skipped_total += dropped
+                                    progress.advance(progress_task, dropped)
+                                    update_progress(active_count=len(inflight))
                                 if live:
                                     live.console.print(
                                         f"[yellow]Skipping model {e.model_id} for remainder of run due to empty responses.[/yellow]"
@@ -489,11 +515,12 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
 
     previous_handler = signal.getsignal(signal.SIGINT)
     signal.signal(signal.SIGINT, _sigint_handler)
+    writer = BatchedJsonlWriter(setup.debates_path)
     try:
-        with Live(render_active({}), console=console, refresh_per_second=4) as live:
+        with writer, Live(render_active({}), console=console, refresh_per_second=4) as live:
             update_progress(active_count=0)
             maybe_update(live, {}, force=True)
-            submit_tasks(plan.tasks, retry_offset=0, live=live)
+            submit_tasks(plan.tasks, writer, retry_offset=0, live=live)
 
             if opts.retry_failed and failed_debates:
                 live.console.print(
@@ -507,9 +534,11 @@ def execute_plan(setup: RunSetup, plan: RunPlan) -> None:
                         continue
                     retry_tasks.append(task)
                 if retry_tasks:
-                    submit_tasks(retry_tasks, retry_offset=17, live=live)
+                    submit_tasks(retry_tasks, writer, retry_offset=17, live=live)
     finally:
         write_progress()
+        if failed_judges_log:
+            failed_judges_log.close()
         signal.signal(signal.SIGINT, previous_handler)
 
 
@@ -2,16 +2,17 @@
 from __future__ import annotations
 
 import json
-import random
 import os
-from collections import defaultdict
+import random
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 
 import typer
 
-from ...storage import load_debate_records
+from ...storage import iter_debate_keys
 from ..common import console
 from .estimate import (
     estimate_cost,
@@ -24,6 +25,7 @@ from .estimate import (
     load_token_stats,
 )
 from .schedule import build_pairs, derive_debate_seed, make_pair_key, select_judges
+from .setup import resolve_max_workers
 from .types import DebateTask, RunPlan, RunSetup
 
 
@@ -39,8 +41,20 @@ def _write_progress(progress_path: Path, run_tag: str, debates_path: Path, total
         "banned_models": sorted(banned_models),
     }
     progress_path.parent.mkdir(parents=True, exist_ok=True)
-    with progress_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    tmp_path = progress_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp_path, progress_path)
+
+
+def _write_json_array(path: Path, items: Iterable[Dict]) -> None:
+    """Stream `items` to `path` in the same layout as `json.dump(list(items), f, indent=2)`."""
+    with path.open("w", encoding="utf-8") as f:
+        first = True
+        for item in items:
+            f.write("[\n  " if first else ",\n  ")
+            f.write(json.dumps(item, indent=2).replace("\n", "\n  "))
+            first = False
+        f.write("[]" if first else "\n]")
 
 
 def build_plan(setup: RunSetup, debates_per_pair: int) -> tuple[RunPlan | None, bool]:
@@ -59,66 +73,83 @@ def build_plan(setup: RunSetup, debates_per_pair: int) -> tuple[RunPlan | None,
     else:
         pairs = build_pairs(setup.debater_models, opts.balanced_sides)
 
-    completed_counts = defaultdict(int)
-    judge_usage = defaultdict(int)
-    existing = setup.existing_records
+    completed_counts: Counter = Counter()
+    judge_usage: Counter = Counter()
     loaded_from_disk = False
-    if (not existing) and opts.resume and setup.debates_path.exists():
-        existing = load_debate_records(setup.debates_path)
+    if setup.existing_records:
+        existing = (
+            (
+                rec.transcript.topic.id,
+                rec.transcript.pro_model_id,
+                rec.transcript.con_model_id,
+                tuple(jres.judge_id for jres in rec.judges),
+            )
+            for rec in setup.existing_records
+        )
+    elif opts.resume and setup.debates_path.exists():
+        # Resume only needs matchup keys and judge ids, not validated transcripts;
+        # keys are streamed straight into the counters.
+        existing = iter_debate_keys(setup.debates_path)
         loaded_from_disk = True
-    if existing:
-        for rec in existing:
-            key = (rec.transcript.topic.id, rec.transcript.pro_model_id, rec.transcript.con_model_id)
-            completed_counts[key] += 1
-            for jres in rec.judges:
-                judge_usage[jres.judge_id] += 1
+    else:
+        existing = ()
+    existing_completed = 0
+    for topic_id, pro_id, con_id, judge_ids in existing:
+        existing_completed += 1
+        completed_counts[(topic_id, pro_id, con_id)] += 1
+        judge_usage.update(judge_ids)
+    if existing_completed:
         if setup.incremental_mode:
             console.print(
-                f"[cyan]Loaded {len(existing)} completed debates from {setup.debates_path}; skipping already-finished pairings for incremental append.[/cyan]"
+                f"[cyan]Loaded {existing_completed} completed debates from {setup.debates_path}; skipping already-finished pairings for incremental append.[/cyan]"
             )
         elif opts.resume and loaded_from_disk:
             console.print(
-                f"[cyan]Resume mode: found {len(existing)} completed debates in {setup.debates_path}; will skip already-finished matchups.[/cyan]"
+                f"[cyan]Resume mode: found {existing_completed} completed debates in {setup.debates_path}; will skip already-finished matchups.[/cyan]"
             )
-    existing_completed = sum(completed_counts.values())
 
-    def remaining_for(topic, a, b):
-        done = completed_counts.get((topic.id, a.id, b.id), 0)
-        return max(0, debates_per_pair - done)
-
-    total_runs = sum(
-        remaining_for(topic, a, b) for topic in setup.topics_selected for (a, b) in pairs
+    # Start from the full topic x pair grid and subtract what is already done; this walks
+    # the completed keys once instead of probing every grid cell.
+    topic_mult = Counter(topic.id for topic in setup.topics_selected)
+    pair_mult = Counter((a.id, b.id) for (a, b) in pairs)
+    total_runs = len(setup.topics_selected) * len(pairs) * debates_per_pair - sum(
+        min(done, debates_per_pair) * topic_mult[topic_id] * pair_mult[(pro_id, con_id)]
+        for (topic_id, pro_id, con_id), done in completed_counts.items()
     )
     console.print(f"Scheduled {total_runs} debates (remaining).")
 
     progress_path = setup.run_dir / "progress.json"
     _write_progress(progress_path, setup.run_tag, setup.debates_path, total_runs, existing_completed, 0, set())
 
-    def build_schedule(include_completed: bool) -> tuple[list[Dict], list[DebateTask]]:
+    def iter_schedule(include_completed: bool) -> Iterator[tuple[Dict, DebateTask]]:
+        """Yield (preview entry, task) per scheduled debate; judge balancing state is per call."""
         usage_counts = judge_usage.copy()
         topic_usage: dict[Tuple[str, str], int] = {}
         pair_usage: dict[Tuple[str, str], int] = {}
-        preview: list[Dict] = []
-        tasks = []
+        # Shared read-only pool; select_judges only indexes/sorts it, so no per-debate copy.
+        all_judges = tuple(setup.judge_models)
+        # Excluding the two debaters depends only on the pair (not on side swaps), so each
+        # pair's judge pool is built once rather than per topic and rep.
+        if opts.judges_from_selection:
+            pair_pools = [
+                [j for j in all_judges if j.id not in (model_a.id, model_b.id)]
+                for (model_a, model_b) in pairs
+            ]
+        else:
+            pair_pools = [all_judges] * len(pairs)
+        may_swap = (not opts.balanced_sides) and opts.swap_sides
         for topic in setup.topics_selected:
-            for (model_a, model_b) in pairs:
-                already_done = completed_counts.get((topic.id, model_a.id, model_b.id), 0)
-                for rep in range(debates_per_pair):
-                    if not include_completed and rep < already_done:
-                        continue
+            for (model_a, model_b), judge_source_pool in zip(pairs, pair_pools):
+                # Finished reps are skipped by the range itself; they never touch judge usage.
+                first_rep = 0 if include_completed else completed_counts.get((topic.id, model_a.id, model_b.id), 0)
+                for rep in range(first_rep, debates_per_pair):
                     debate_seed = derive_debate_seed(
                         setup.run_tag, topic.id, model_a.id, model_b.id, rep
                     )
-                    debate_rng = random.Random(debate_seed)
                     pro_model = model_a
                     con_model = model_b
-                    if (not opts.balanced_sides) and opts.swap_sides and debate_rng.random() < 0.5:
+                    if may_swap and random.Random(debate_seed).random() < 0.5:
                         pro_model, con_model = con_model, pro_model
-                    judge_source_pool = list(setup.judge_models)
-                    if opts.judges_from_selection:
-                        judge_source_pool = [
-                            j for j in setup.judge_models if j.id not in {pro_model.id, con_model.id}
-                        ]
                     pair_key = make_pair_key(pro_model.id, con_model.id)
                     judges_chosen: list[str] = []
                     panel_configs = []
@@ -150,40 +181,33 @@ def build_plan(setup: RunSetup, debates_per_pair: int) -> tuple[RunPlan | None,
                                 usage_counts[j.id] = usage_counts.get(j.id, 0) + 1
                                 topic_usage[(j.id, topic.id)] = topic_usage.get((j.id, topic.id), 0) + 1
                                 pair_usage[(j.id, pair_key)] = pair_usage.get((j.id, pair_key), 0) + 1
-                            remaining_candidates = [
-                                j for j in judge_source_pool if j.id not in {cfg.id for cfg in panel_configs}
-                            ]
-                    preview.append(
-                        {
-                            "topic": topic.id,
-                            "pro": pro_model.id,
-                            "con": con_model.id,
-                            "judges": judges_chosen,
-                            "rep": rep,
-                        }
-                    )
+                            chosen_ids = set(judges_chosen)
+                            remaining_candidates = [j for j in judge_source_pool if j.id not in chosen_ids]
+                    entry = {
+                        "topic": topic.id,
+                        "pro": pro_model.id,
+                        "con": con_model.id,
+                        "judges": judges_chosen,
+                        "rep": rep,
+                    }
                     task_id = f"{topic.id}|{pro_model.id}|{con_model.id}|{rep}"
-                    tasks.append(
-                        DebateTask(
-                            topic=topic,
-                            pro_model=pro_model,
-                            con_model=con_model,
-                            rep=rep,
-                            seed=debate_seed,
-                            panel_configs=panel_configs,
-                            remaining_candidates=remaining_candidates,
-                            pair_key=pair_key,
-                            task_id=task_id,
-                        )
+                    yield entry, DebateTask(
+                        topic=topic,
+                        pro_model=pro_model,
+                        con_model=con_model,
+                        rep=rep,
+                        seed=debate_seed,
+                        panel_configs=panel_configs,
+                        remaining_candidates=remaining_candidates,
+                        pair_key=pair_key,
+                        task_id=task_id,
                     )
-        return preview, tasks
 
-    schedule_preview_for_estimate = None
     schedule_tasks_for_estimate: list[DebateTask] = []
     if opts.estimate_time:
-        schedule_preview_for_estimate, schedule_tasks_for_estimate = build_schedule(include_completed=False)
+        schedule_tasks_for_estimate = [task for _entry, task in iter_schedule(include_completed=False)]
         snapshots = load_timing_snapshots(Path("results"))
-        max_workers = min(64, (os.cpu_count() or 4) * 8)
+        max_workers = resolve_max_workers(opts)
         per_model_cap = max_workers
         median_sec, hist_n = historical_debate_durations(Path("results"))
         per_debate_sec = median_sec if median_sec is not None else 60.0
@@ -226,11 +250,20 @@ def build_plan(setup: RunSetup, debates_per_pair: int) -> tuple[RunPlan | None,
     # Dry-run path: cost/time + schedule preview, then exit.
     if opts.dry_run:
         judge_calls = total_runs * main_cfg.num_judges
-        activity_pricing, activity_path = load_activity_pricing()
         models_needed = {m.model for m in setup.debater_models} | {
             j.model for j in setup.judge_models
         }
-        pricing_map = fetch_pricing(models_needed, setup.settings)
+        # Independent inputs: the catalog fetch waits on the network while the two history
+        # files are read, so run all three at once.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            pricing_future = pool.submit(
+                fetch_pricing, models_needed, setup.settings, refresh=opts.refresh_catalog
+            )
+            activity_future = pool.submit(load_activity_pricing)
+            stats_future = pool.submit(load_token_stats)
+            pricing_map = pricing_future.result()
+            activity_pricing, activity_path = activity_future.result()
+            deb_stats, judge_stats, stats_path = stats_future.result()
         pricing_source_label = "live (OpenRouter catalog)"
         if activity_pricing:
             pricing_map.update(activity_pricing)
@@ -239,7 +272,6 @@ def build_plan(setup: RunSetup, debates_per_pair: int) -> tuple[RunPlan | None,
             else:
                 pricing_source_label = "activity + live fallback"
 
-        deb_stats, judge_stats, stats_path = load_token_stats()
         stats_label = f"turn averages from {stats_path.name}" if stats_path else "no historical token stats"
         total_debater_cost, per_model_cost, total_judge_cost, per_judge_cost = estimate_cost(
             setup.debater_models,
@@ -284,13 +316,20 @@ def build_plan(setup: RunSetup, debates_per_pair: int) -> tuple[RunPlan | None,
         for jid, cost in sorted(per_judge_cost.items(), key=lambda kv: kv[1], reverse=True):
             console.print(f"  {jid}: ~${cost:.2f}")
 
-        schedule_preview, _tasks = build_schedule(include_completed=True)
+        # Entries are streamed to disk as they are scheduled; only the first 10 are kept for display.
+        head: list[Dict] = []
+
+        def preview_entries() -> Iterator[Dict]:
+            for entry, _task in iter_schedule(include_completed=True):
+                if len(head) < 10:
+                    head.append(entry)
+                yield entry
+
         sched_path = setup.run_dir / "dryrun_schedule.json"
-        with sched_path.open("w", encoding="utf-8") as f:
-            json.dump(schedule_preview, f, indent=2)
+        _write_json_array(sched_path, preview_entries())
         console.print(f"Saved full debate/judge schedule preview to {sched_path}")
         console.print("First 10 debates:")
-        for i, entry in enumerate(schedule_preview[:10], start=1):
+        for i, entry in enumerate(head, start=1):
             console.print(
                 f"  {i}. Topic {entry['topic']}: PRO={entry['pro']} vs CON={entry['con']} | judges={', '.join(entry['judges']) if entry['judges'] else 'n/a'}"
             )
@@ -302,7 +341,7 @@ def build_plan(setup: RunSetup, debates_per_pair: int) -> tuple[RunPlan | None,
     if schedule_tasks_for_estimate:
         schedule_tasks = schedule_tasks_for_estimate
     else:
-        _schedule_preview, schedule_tasks = build_schedule(include_completed=False)
+        schedule_tasks = [task for _entry, task in iter_schedule(include_completed=False)]
 
     plan = RunPlan(
         topics_selected=setup.topics_selected,
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from pathlib import Path
-import os
 
 import typer
 
@@ -10,6 +9,7 @@ from ..common import console
 from ..leaderboard import show_leaderboard
 from ..plot import plot_command
 from .estimate import write_timing_snapshot
+from .setup import resolve_max_workers
 from ..rate import rate_command
 from ..summarize import summarize
 from .types import RunSetup
@@ -26,7 +26,7 @@ def run_postrun(setup: RunSetup) -> None:
         plot_command(viz_dir=setup.viz_dir, out_dir=setup.plots_dir)
     else:
         console.print("[green]Run complete.[/green]")
-    max_workers = min(64, (os.cpu_count() or 4) * 8)
+    max_workers = resolve_max_workers(opts)
     per_model_cap = max_workers
     write_timing_snapshot(
         debates_path=setup.debates_path,
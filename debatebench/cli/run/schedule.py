@@ -4,6 +4,7 @@ from __future__ import annotations
 import hashlib
 import itertools
 import random
+from functools import lru_cache
 from typing import List, Tuple
 
 import typer
@@ -11,10 +12,12 @@ import typer
 UsageKey = Tuple[str, str]
 
 
+@lru_cache(maxsize=4096)
 def derive_debate_seed(tag: str, topic_id: str, pro_id: str, con_id: str, rep: int) -> int:
     """
     Deterministically derive a per-debate seed so resumes reproduce the same
-    side swaps and judge panels.
+    side swaps and judge panels. Memoized: the planner derives the same seeds for
+    both the preview and task schedules.
     """
     key = f"{tag}|{topic_id}|{pro_id}|{con_id}|{rep}".encode("utf-8")
     digest = hashlib.blake2s(key, digest_size=8).digest()
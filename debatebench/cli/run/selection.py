@@ -12,11 +12,26 @@ class SelectionCancelled(Exception):
     """Raised when the user cancels the selection wizard."""
 
 
+def sort_topics(topics):
+    """Display order shared by every topic picker; callers sort once and pass the result in."""
+    return sorted(topics, key=lambda t: (t.category or "", t.motion))
+
+
+def _label_created(catalog):
+    """Format each entry's created date once (as `_created_str`) so draw() doesn't strftime per row per keypress."""
+    for entry in catalog:
+        if "_created_str" not in entry:
+            created = entry.get("created")
+            entry["_created_str"] = created.strftime("%Y-%m-%d") if created else ""
+    return catalog
+
+
 def _interactive_select_models(catalog, console: Console, title: str = "OpenRouter Models (alphabetical)"):
     """
     Curses-based selector: arrow keys to move, Enter/Space to toggle, c to continue, q to cancel.
     Falls back to simple enable prompt if curses is unavailable.
     """
+    _label_created(catalog)
     try:
         import curses
     except Exception:
@@ -28,24 +43,30 @@ def _interactive_select_models(catalog, console: Console, title: str = "OpenRout
         idx = 0
 
         def draw():
-            stdscr.clear()
+            # erase() rather than clear(): refresh() then repaints only the cells that changed
+            # instead of forcing a full-screen redraw on every keypress.
+            stdscr.erase()
             header = f"{title} (Enter/Space toggle ON/OFF, ↑/↓ move, c=continue, q=cancel; default is OFF)"
             stdscr.addstr(0, 0, header, curses.A_BOLD)
+            # Terminal size is read once per frame (it only changes on KEY_RESIZE).
+            width = curses.COLS - 1
             max_rows = curses.LINES - 2
             start = max(0, idx - max_rows + 1)
-            visible = catalog[start : start + max_rows]
-            for offset, entry in enumerate(visible):
+            for offset in range(min(max_rows, len(catalog) - start)):
                 real_idx = start + offset
+                entry = catalog[real_idx]
                 cursor = ">" if real_idx == idx else " "
                 mark = "[x]" if selected[real_idx] else "[ ]"
-                line = f"{cursor} {mark} {entry['id']} ({entry['created'].strftime('%Y-%m-%d')})"
-                stdscr.addstr(offset + 1, 0, line[: curses.COLS - 1])
+                line = f"{cursor} {mark} {entry['id']} ({entry['_created_str']})"
+                stdscr.addstr(offset + 1, 0, line[:width])
             stdscr.refresh()
 
         draw()
         while True:
             ch = stdscr.getch()
-            if ch in (curses.KEY_UP, ord("k")):
+            if ch == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+            elif ch in (curses.KEY_UP, ord("k")):
                 idx = (idx - 1) % len(catalog)
             elif ch in (curses.KEY_DOWN, ord("j")):
                 idx = (idx + 1) % len(catalog)
@@ -71,8 +92,9 @@ def _fallback_select_models(catalog, console: Console, title: str = "OpenRouter
     table.add_column("#", justify="right")
     table.add_column("Model ID")
     table.add_column("Created (UTC)")
+    _label_created(catalog)
     for idx, entry in enumerate(catalog, start=1):
-        table.add_row(str(idx), entry["id"], entry["created"].strftime("%Y-%m-%d"))
+        table.add_row(str(idx), entry["id"], entry["_created_str"])
     console.print(table)
 
     prompt_text = "Enter comma-separated indexes to enable (blank enables none): "
@@ -97,51 +119,53 @@ def _fallback_select_models(catalog, console: Console, title: str = "OpenRouter
 def _interactive_select_topics(topics, console: Console):
     """
     Topic selector shown before models. Defaults to OFF; user toggles ON.
+    Expects `topics` already in display order (see `sort_topics`).
     """
     try:
         import curses
     except Exception:
         return _fallback_select_topics(topics, console)
 
-    topics_sorted = sorted(topics, key=lambda t: (t.category or "", t.motion))
-
     def menu(stdscr):
         curses.curs_set(0)
-        selected = [False] * len(topics_sorted)
+        selected = [False] * len(topics)
         idx = 0
 
         def draw():
-            stdscr.clear()
+            stdscr.erase()
             stdscr.addstr(
                 0,
                 0,
                 "Topics (Enter/Space toggle ON/OFF, ↑/↓ move, c=continue, q=cancel; default is OFF)",
                 curses.A_BOLD,
             )
+            cols = curses.COLS
             max_rows = curses.LINES - 2
             start = max(0, idx - max_rows + 1)
-            visible = topics_sorted[start : start + max_rows]
-            for offset, entry in enumerate(visible):
+            for offset in range(min(max_rows, len(topics) - start)):
                 real_idx = start + offset
+                entry = topics[real_idx]
                 cursor = ">" if real_idx == idx else " "
                 mark = "[x]" if selected[real_idx] else "[ ]"
-                motion = entry.motion if len(entry.motion) < curses.COLS - 20 else entry.motion[: curses.COLS - 23] + "..."
+                motion = entry.motion if len(entry.motion) < cols - 20 else entry.motion[: cols - 23] + "..."
                 cat = entry.category or "-"
                 line = f"{cursor} {mark} {cat}: {motion}"
-                stdscr.addstr(offset + 1, 0, line[: curses.COLS - 1])
+                stdscr.addstr(offset + 1, 0, line[: cols - 1])
             stdscr.refresh()
 
         draw()
         while True:
             ch = stdscr.getch()
-            if ch in (curses.KEY_UP, ord("k")):
+            if ch == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+            elif ch in (curses.KEY_UP, ord("k")):
                 idx = (idx - 1) % len(topics)
             elif ch in (curses.KEY_DOWN, ord("j")):
                 idx = (idx + 1) % len(topics)
             elif ch in (10, 13, ord(" "), ord("\n")):  # Enter or space toggles
                 selected[idx] = not selected[idx]
             elif ch in (ord("c"), ord("C")):  # continue
-                return [t for i, t in enumerate(topics_sorted) if selected[i]]
+                return [t for i, t in enumerate(topics) if selected[i]]
             elif ch in (ord("q"), ord("Q")):
                 return []
             draw()
@@ -157,10 +181,8 @@ def _fallback_select_topics(topics, console: Console):
     table.add_column("#", justify="right")
     table.add_column("Category")
     table.add_column("Motion")
-    table.add_column("Category")
-    topics_sorted = sorted(topics, key=lambda t: (t.category or "", t.motion))
-    for idx, t in enumerate(topics_sorted, start=1):
-        table.add_row(str(idx), t.category or "-", t.motion, t.category or "-")
+    for idx, t in enumerate(topics, start=1):
+        table.add_row(str(idx), t.category or "-", t.motion)
     console.print(table)
     prompt_text = "Enter comma-separated indexes to ENABLE (blank enables none): "
     raw = typer.prompt(prompt_text, default="")
@@ -174,10 +196,10 @@ def _fallback_select_topics(topics, console: Console):
                 val = int(p)
             except ValueError:
                 raise typer.BadParameter(f"Invalid index: {p}")
-            if val < 1 or val > len(topics_sorted):
+            if val < 1 or val > len(topics):
                 raise typer.BadParameter(f"Index out of range: {val}")
             enabled.add(val)
-    return [t for idx, t in enumerate(topics_sorted, start=1) if idx in enabled]
+    return [t for idx, t in enumerate(topics, start=1) if idx in enabled]
 
 
 def selection_wizard(
@@ -190,7 +212,8 @@ def selection_wizard(
     popular_ids: List[str] | None = None,
 ):
     """
-    Unified curses wizard for topic/model/judge selection.
+    Unified curses wizard for topic/model/judge selection. `topics` should already be
+    in display order (see `sort_topics`).
     Returns (selected_topics, selected_models, selected_judges) or None if cancelled.
     """
     try:
@@ -200,12 +223,11 @@ def selection_wizard(
 
     steps = []
     if enable_topics and topics:
-        topics_sorted = sorted(topics, key=lambda t: (t.category or "", t.motion))
         steps.append(
             {
                 "name": "Topics",
-                "items": topics_sorted,
-                "selected": [False] * len(topics_sorted),
+                "items": topics,
+                "selected": [False] * len(topics),
                 "type": "topic",
             }
         )
@@ -213,7 +235,7 @@ def selection_wizard(
         steps.append(
             {
                 "name": "Debaters",
-                "items": model_catalog,
+                "items": _label_created(model_catalog),
                 "selected": [False] * len(model_catalog),
                 "type": "model",
             }
@@ -222,7 +244,7 @@ def selection_wizard(
         steps.append(
             {
                 "name": "Judges",
-                "items": judge_catalog,
+                "items": _label_created(judge_catalog),
                 "selected": [False] * len(judge_catalog),
                 "type": "judge",
             }
@@ -231,8 +253,7 @@ def selection_wizard(
     if not steps:
         return None
 
-    def render_line(stdscr, row, text, highlight=False):
-        maxw = curses.COLS - 1
+    def render_line(stdscr, row, text, maxw, highlight=False):
         txt = text[: maxw]
         if highlight:
             stdscr.addstr(row, 0, txt, curses.A_REVERSE)
@@ -253,21 +274,22 @@ def selection_wizard(
                 cursor_idx = max(0, min(cursor_idx, len(curr_items) - 1))
 
         def draw():
-            stdscr.clear()
+            stdscr.erase()
             step = steps[step_idx]
             total_steps = len(steps)
             header = (
                 f"Step {step_idx+1}/{total_steps} - {step['name']} "
                 "(Space/Enter toggle, ↑/↓ move, n=next, b=back, q=cancel)"
             )
-            render_line(stdscr, 0, header, highlight=True)
+            maxw = curses.COLS - 1
+            render_line(stdscr, 0, header, maxw, highlight=True)
             items = step["items"]
             selected = step["selected"]
             max_rows = curses.LINES - 2
             start = max(0, cursor_idx - max_rows + 1)
-            visible = items[start : start + max_rows]
-            for offset, entry in enumerate(visible):
+            for offset in range(min(max_rows, len(items) - start)):
                 real_idx = start + offset
+                entry = items[real_idx]
                 cursor = ">" if real_idx == cursor_idx else " "
                 mark = "[x]" if selected[real_idx] else "[ ]"
                 if step["type"] == "topic":
@@ -275,17 +297,17 @@ def selection_wizard(
                     motion = entry.motion
                     desc = f"{cat}: {motion}"
                 else:
-                    created = entry.get("created")
-                    cstr = created.strftime("%Y-%m-%d") if created else ""
-                    desc = f"{entry.get('id')} ({cstr})"
+                    desc = f"{entry.get('id')} ({entry['_created_str']})"
                 line = f"{cursor} {mark} {desc}"
-                render_line(stdscr, offset + 1, line)
+                render_line(stdscr, offset + 1, line, maxw)
             stdscr.refresh()
 
         draw()
         while True:
             ch = stdscr.getch()
-            if ch in (curses.KEY_UP, ord("k")):
+            if ch == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+            elif ch in (curses.KEY_UP, ord("k")):
                 cursor_idx = max(0, cursor_idx - 1)
             elif ch in (curses.KEY_DOWN, ord("j")):
                 cursor_idx = min(len(steps[step_idx]["items"]) - 1, cursor_idx + 1)
@@ -324,6 +346,7 @@ def selection_wizard(
 
 __all__ = [
     "SelectionCancelled",
+    "sort_topics",
     "_interactive_select_models",
     "_fallback_select_models",
     "_interactive_select_topics",
@@ -7,7 +7,6 @@ from typing import Optional
 
 import typer
 
-from ..common import console
 from .selection_incremental import apply_incremental_selection, _infer_debates_per_pair
 from .selection_quick import apply_judges_test_selection, apply_quick_test_selection
 from .selection_standard import apply_standard_selection
@@ -27,7 +26,8 @@ def _apply_stage_limits(main_cfg, max_tokens: Optional[int]):
     new_rounds = []
     for r in main_cfg.rounds:
         lim = stage_limits.get(r.stage, r.token_limit)
-        new_rounds.append(r.copy(update={"token_limit": lim}))
+        # Only copy rounds whose limit actually changes.
+        new_rounds.append(r if lim == r.token_limit else r.model_copy(update={"token_limit": lim}))
     main_cfg.rounds = new_rounds
 
 
@@ -119,18 +119,19 @@ def perform_selection(setup: RunSetup) -> tuple[RunSetup, int]:
         "retry_failed": opts.retry_failed,
         "dry_run": opts.dry_run,
         "postrate": opts.postrate,
+        "max_workers": opts.max_workers,
     }
-    with setup.cli_args_path.open("w", encoding="utf-8") as f:
-        json.dump(cli_args, f, indent=2)
+    # Encode to one string and write once; json.dump issues a write() per token.
+    setup.cli_args_path.write_text(json.dumps(cli_args, indent=2), encoding="utf-8")
 
+    # model_dump is the native v2 path; .dict() adds a deprecation shim per call.
     selection_snapshot = {
-        "main_config": state.main_cfg.dict(),
-        "topics_selected": [t.dict() for t in state.topics_selected],
-        "debater_models": [m.dict() for m in state.debater_models],
-        "judge_models": [j.dict() for j in state.judge_models],
+        "main_config": state.main_cfg.model_dump(),
+        "topics_selected": [t.model_dump() for t in state.topics_selected],
+        "debater_models": [m.model_dump() for m in state.debater_models],
+        "judge_models": [j.model_dump() for j in state.judge_models],
     }
-    with setup.selection_snapshot_path.open("w", encoding="utf-8") as f:
-        json.dump(selection_snapshot, f, indent=2)
+    setup.selection_snapshot_path.write_text(json.dumps(selection_snapshot, indent=2), encoding="utf-8")
 
     setup.main_cfg = state.main_cfg
     setup.topics_selected = state.topics_selected
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import typer
 
-from ...openrouter import fetch_recent_openrouter_models, probe_model
+from ...openrouter import cached_fetch_recent_openrouter_models, probe_models_concurrent
 from ...schema import DebaterModelConfig, JudgeModelConfig
 from ..common import console
 from .selection import (
@@ -11,10 +11,49 @@ from .selection import (
     _interactive_select_models,
     _interactive_select_topics,
     selection_wizard,
+    sort_topics,
 )
 from .selection_state import SelectionState
 
 
+def _openrouter_debater(entry, opts) -> DebaterModelConfig:
+    model_id = entry["id"]
+    return DebaterModelConfig(
+        id=model_id.replace("/", "-"),
+        provider="openrouter",
+        model=model_id,
+        token_limit=opts.openrouter_max_tokens,
+        endpoint=None,
+        parameters={"temperature": opts.openrouter_temperature},
+    )
+
+
+def _openrouter_judge(entry, opts) -> JudgeModelConfig:
+    model_id = entry["id"]
+    return JudgeModelConfig(
+        id=model_id.replace("/", "-"),
+        provider="openrouter",
+        model=model_id,
+        token_limit=opts.openrouter_judge_max_tokens,
+        endpoint=None,
+        prompt_style=None,
+        parameters={"temperature": opts.openrouter_temperature},
+    )
+
+
+def _probe_all(models, settings):
+    """Probe every model concurrently; returns (usable, [(model, error), ...]) in input order."""
+    errors = probe_models_concurrent(
+        (m.model for m in models),
+        api_key=settings.openrouter_api_key,
+        site_url=settings.openrouter_site_url,
+        site_name=settings.openrouter_site_name,
+    )
+    usable = [m for m in models if errors[m.model] is None]
+    dropped = [(m, errors[m.model]) for m in models if errors[m.model] is not None]
+    return usable, dropped
+
+
 def apply_standard_selection(state: SelectionState, setup) -> SelectionState:
     opts = setup.options
     debater_catalog = None
@@ -24,11 +63,13 @@ def apply_standard_selection(state: SelectionState, setup) -> SelectionState:
         console.print(
             f"[cyan]Fetching OpenRouter models from the last {opts.openrouter_months} month(s)...[/cyan]"
         )
-        debater_catalog = fetch_recent_openrouter_models(
+        debater_catalog = cached_fetch_recent_openrouter_models(
             months=opts.openrouter_months,
             api_key=setup.settings.openrouter_api_key,
             site_url=setup.settings.openrouter_site_url,
             site_name=setup.settings.openrouter_site_name,
+            ttl_s=setup.settings.openrouter_catalog_ttl,
+            refresh=opts.refresh_catalog,
         )
         if not debater_catalog:
             raise typer.BadParameter(
@@ -41,22 +82,27 @@ def apply_standard_selection(state: SelectionState, setup) -> SelectionState:
         console.print(
             f"[cyan]Fetching OpenRouter judge candidates from the last {months_j} month(s)...[/cyan]"
         )
-        judge_catalog = fetch_recent_openrouter_models(
+        judge_catalog = cached_fetch_recent_openrouter_models(
             months=months_j,
             api_key=setup.settings.openrouter_api_key,
             site_url=setup.settings.openrouter_site_url,
             site_name=setup.settings.openrouter_site_name,
+            ttl_s=setup.settings.openrouter_catalog_ttl,
+            refresh=opts.refresh_catalog,
         )
         if not judge_catalog:
             raise typer.BadParameter(
                 f"No text-based OpenRouter models found in the last {months_j} month(s) for judges."
             )
 
+    # Sorted once for whichever picker ends up showing them.
+    topics_sorted = sort_topics(state.topics) if opts.topic_select else []
+
     used_wizard = False
     if opts.tui_wizard:
         try:
             wizard_result = selection_wizard(
-                topics=state.topics if opts.topic_select else [],
+                topics=topics_sorted,
                 model_catalog=debater_catalog if opts.openrouter_select else [],
                 judge_catalog=judge_catalog if (not opts.judges_from_selection) else [],
                 enable_topics=opts.topic_select,
@@ -71,38 +117,13 @@ def apply_standard_selection(state: SelectionState, setup) -> SelectionState:
             state.topics_selected, debater_entries, judge_entries = wizard_result
             if not state.topics_selected:
                 raise typer.BadParameter("All topics were disabled; nothing to run.")
-            state.debater_models = []
-            for entry in debater_entries:
-                model_id = entry["id"]
-                state.debater_models.append(
-                    DebaterModelConfig(
-                        id=model_id.replace("/", "-"),
-                        provider="openrouter",
-                        model=model_id,
-                        token_limit=opts.openrouter_max_tokens,
-                        endpoint=None,
-                        parameters={"temperature": opts.openrouter_temperature},
-                    )
-                )
+            state.debater_models = [_openrouter_debater(entry, opts) for entry in debater_entries]
             if not state.debater_models:
                 raise typer.BadParameter("All models were disabled; nothing to run.")
             if opts.judges_from_selection:
                 state.judge_models = state.debater_models
             else:
-                state.judge_models = []
-                for entry in judge_entries:
-                    model_id = entry["id"]
-                    state.judge_models.append(
-                        JudgeModelConfig(
-                            id=model_id.replace("/", "-"),
-                            provider="openrouter",
-                            model=model_id,
-                            token_limit=opts.openrouter_judge_max_tokens,
-                            endpoint=None,
-                            prompt_style=None,
-                            parameters={"temperature": opts.openrouter_temperature},
-                        )
-                    )
+                state.judge_models = [_openrouter_judge(entry, opts) for entry in judge_entries]
                 if not state.judge_models:
                     raise typer.BadParameter("All judge models were disabled; nothing to run.")
             if opts.sample_topics is not None:
@@ -115,7 +136,7 @@ def apply_standard_selection(state: SelectionState, setup) -> SelectionState:
     if not used_wizard:
         state.topics_selected = state.topics
         if opts.topic_select:
-            state.topics_selected = _interactive_select_topics(state.topics, console)
+            state.topics_selected = _interactive_select_topics(topics_sorted, console)
             if not state.topics_selected:
                 raise typer.BadParameter("All topics were disabled; nothing to run.")
         if opts.sample_topics is not None:
@@ -132,38 +153,14 @@ def apply_standard_selection(state: SelectionState, setup) -> SelectionState:
             if not selected_entries:
                 raise typer.BadParameter("All models were disabled; nothing to run.")
 
-            state.debater_models = []
-            for entry in selected_entries:
-                model_id = entry["id"]
-                state.debater_models.append(
-                    DebaterModelConfig(
-                        id=model_id.replace("/", "-"),
-                        provider="openrouter",
-                        model=model_id,
-                        token_limit=opts.openrouter_max_tokens,
-                        endpoint=None,
-                        parameters={"temperature": opts.openrouter_temperature},
-                    )
-                )
+            state.debater_models = [_openrouter_debater(entry, opts) for entry in selected_entries]
             console.print(
                 f"[green]Selected {len(state.debater_models)} debater models from OpenRouter (last {opts.openrouter_months} month(s)).[/green]"
             )
 
         if opts.openrouter_probe and state.debater_models:
             console.print("[cyan]Probing selected models with 1-token requests...[/cyan]")
-            usable = []
-            dropped = []
-            for m in state.debater_models:
-                err = probe_model(
-                    model_id=m.model,
-                    api_key=setup.settings.openrouter_api_key,
-                    site_url=setup.settings.openrouter_site_url,
-                    site_name=setup.settings.openrouter_site_name,
-                )
-                if err is None:
-                    usable.append(m)
-                else:
-                    dropped.append((m, err))
+            usable, dropped = _probe_all(state.debater_models, setup.settings)
             if dropped:
                 console.print("[yellow]Dropping models that failed probe:[/yellow]")
                 for m, err in dropped:
@@ -183,35 +180,10 @@ def apply_standard_selection(state: SelectionState, setup) -> SelectionState:
             )
             if not selected_judges:
                 raise typer.BadParameter("All judge models were disabled; nothing to run.")
-            state.judge_models = []
-            for entry in selected_judges:
-                model_id = entry["id"]
-                state.judge_models.append(
-                    JudgeModelConfig(
-                        id=model_id.replace("/", "-"),
-                        provider="openrouter",
-                        model=model_id,
-                        token_limit=opts.openrouter_judge_max_tokens,
-                        endpoint=None,
-                        prompt_style=None,
-                        parameters={"temperature": opts.openrouter_temperature},
-                    )
-                )
+            state.judge_models = [_openrouter_judge(entry, opts) for entry in selected_judges]
             if opts.openrouter_probe and state.judge_models:
                 console.print("[cyan]Probing selected judge models with 1-token requests...[/cyan]")
-                usable_j = []
-                dropped_j = []
-                for j in state.judge_models:
-                    err = probe_model(
-                        model_id=j.model,
-                        api_key=setup.settings.openrouter_api_key,
-                        site_url=setup.settings.openrouter_site_url,
-                        site_name=setup.settings.openrouter_site_name,
-                    )
-                    if err is None:
-                        usable_j.append(j)
-                    else:
-                        dropped_j.append((j, err))
+                usable_j, dropped_j = _probe_all(state.judge_models, setup.settings)
                 if dropped_j:
                     console.print("[yellow]Dropping judges that failed probe:[/yellow]")
                     for j, err in dropped_j:
@@ -1,6 +1,7 @@
 """Setup helpers for the `debatebench run` command."""
 from __future__ import annotations
 
+import os
 import random
 import shutil
 from datetime import datetime, timezone
@@ -19,6 +20,13 @@ def _slugify_model_id(model_id: str) -> str:
     return model_id.replace("/", "-").replace(" ", "_")
 
 
+def resolve_max_workers(options: RunOptions) -> int:
+    """Debate concurrency: --max-workers if given, else min(64, 8 x CPU count) (calls are network-bound)."""
+    if options.max_workers:
+        return options.max_workers
+    return min(64, (os.cpu_count() or 4) * 8)
+
+
 def prepare_run(options: RunOptions) -> RunSetup:
     """Load configs/settings and establish run directories + snapshots."""
     (
@@ -66,7 +74,9 @@ def prepare_run(options: RunOptions) -> RunSetup:
             dest = snapshot_dir / src.name
             if incremental_mode and dest.exists():
                 continue
-            shutil.copy(src, dest)
+            # Real copy, not a hardlink: the snapshot must not follow later in-place edits.
+            # copyfile already uses in-kernel sendfile on Linux and skips copy()'s chmod.
+            shutil.copyfile(src, dest)
         except FileNotFoundError:
             pass
 
@@ -104,4 +114,4 @@ def prepare_run(options: RunOptions) -> RunSetup:
     )
 
 
-__all__ = ["prepare_run"]
+__all__ = ["prepare_run", "resolve_max_workers"]
@@ -31,6 +31,7 @@ class RunOptions:
     balanced_judges: bool
     openrouter_select: bool
     openrouter_months: int
+    refresh_catalog: bool
     openrouter_temperature: float
     openrouter_max_tokens: Optional[int]
     openrouter_probe: bool
@@ -57,6 +58,7 @@ class RunOptions:
     postupload_include_artifacts: bool
     postupload_dry_run: bool
     estimate_time: bool
+    max_workers: Optional[int]
 
 
 @dataclass
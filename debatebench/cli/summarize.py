@@ -4,13 +4,39 @@ from __future__ import annotations
 
 import csv
 from collections import defaultdict
+from itertools import chain, combinations
 from pathlib import Path
 
 import typer
 
-from ..storage import load_debate_records
+from ..storage import stream_debate_records
 from .common import console
 
+# Coalesce the many small CSV row writes into few large filesystem writes.
+CSV_BUFFER_BYTES = 1 << 20
+GAP_BATCH_ROWS = 8192
+
+
+TIMING_KEYS = ("pro", "con")
+TOKEN_KEYS = ("pro_prompt", "pro_completion", "con_prompt", "con_completion")
+COST_KEYS = ("pro_cost", "con_cost")
+
+
+def _open_csv(path: Path):
+    return path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_BYTES)
+
+
+def _bucket(store: dict, model_id: str, keys) -> dict:
+    buckets = store.get(model_id)
+    if buckets is None:
+        buckets = store[model_id] = {k: [] for k in keys}
+    return buckets
+
+
+def _observed(store: dict):
+    """Per-model buckets that received at least one sample."""
+    return [(model_id, buckets) for model_id, buckets in store.items() if any(buckets.values())]
+
 
 def summarize(
     debates_path: Path = typer.Option(
@@ -34,93 +60,156 @@ def summarize(
     - token_usage.csv (mean prompt/completion tokens per model side)
     - cost_usage.csv (mean observed USD cost per model side; falls back to tokens if missing)
     """
-    debates = load_debate_records(debates_path)
-    if not debates:
+    import pandas as pd
+
+    records = stream_debate_records(debates_path)
+    first = next(records, None)
+    if first is None:
         console.print(f"[red]No debates found at {debates_path}")
         raise typer.Exit(code=1)
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Winner counts
     win_counts = defaultdict(int)
-    for d in debates:
-        win_counts[d.aggregate.winner] += 1
-    with (out_dir / "winner_counts.csv").open("w", newline="", encoding="utf-8") as f:
+    topic_stats = defaultdict(lambda: defaultdict(int))
+    # Per-model per-dimension scores (by side)
+    # We attribute mean_pro scores to pro_model_id, mean_con to con_model_id.
+    dim_rows = []
+    turn_duration = {}
+    token_usage = {}
+    cost_usage = {}
+    pair_agree = {}
+    pair_total = {}
+    judge_match_majority = {}
+    judge_total = {}
+    judge_winner_counts = {}
+    pa, pt = pair_agree, pair_total
+    jt, jm = judge_total, judge_match_majority
+    side_stats = defaultdict(lambda: {"pro_w":0,"pro_l":0,"pro_t":0,"con_w":0,"con_l":0,"con_t":0})
+
+    # Single streaming pass over the debates file: every summary is accumulated here and
+    # dimension score gaps (mean_pro - mean_con) are written out as records are parsed.
+    with _open_csv(out_dir / "dimension_score_gaps.csv") as gaps_f:
+        gap_writer = csv.writer(gaps_f)
+        gap_writer.writerow(["debate_id", "dimension", "gap"])
+        batch = []
+        for d in chain((first,), records):
+            pro_id = d.transcript.pro_model_id
+            con_id = d.transcript.con_model_id
+            mean_pro = d.aggregate.mean_pro
+            mean_con = d.aggregate.mean_con
+            majority = d.aggregate.winner
+
+            # Winner counts, topic win rates, model winrate by side
+            win_counts[majority] += 1
+            topic_stats[d.transcript.topic.id][majority] += 1
+            if majority == "pro":
+                side_stats[pro_id]["pro_w"] += 1
+                side_stats[con_id]["con_l"] += 1
+            elif majority == "con":
+                side_stats[pro_id]["pro_l"] += 1
+                side_stats[con_id]["con_w"] += 1
+            else:
+                side_stats[pro_id]["pro_t"] += 1
+                side_stats[con_id]["con_t"] += 1
+
+            dim_rows.extend((pro_id, dim, score) for dim, score in mean_pro.items())
+            dim_rows.extend((con_id, dim, score) for dim, score in mean_con.items())
+            debate_id = d.transcript.debate_id
+            batch.extend([debate_id, dim, score - mean_con.get(dim, 0.0)] for dim, score in mean_pro.items())
+            if len(batch) >= GAP_BATCH_ROWS:
+                gap_writer.writerows(batch)
+                batch.clear()
+
+            # accumulate timing and token usage; resolve each side's target lists once per debate
+            pro_td = _bucket(turn_duration, pro_id, TIMING_KEYS)["pro"]
+            con_td = _bucket(turn_duration, con_id, TIMING_KEYS)["con"]
+            pro_tu = _bucket(token_usage, pro_id, TOKEN_KEYS)
+            con_tu = _bucket(token_usage, con_id, TOKEN_KEYS)
+            pro_prompt, pro_completion = pro_tu["pro_prompt"], pro_tu["pro_completion"]
+            con_prompt, con_completion = con_tu["con_prompt"], con_tu["con_completion"]
+            pro_cost = _bucket(cost_usage, pro_id, COST_KEYS)["pro_cost"]
+            con_cost = _bucket(cost_usage, con_id, COST_KEYS)["con_cost"]
+            for t in d.transcript.turns:
+                if t.speaker == "pro":
+                    durations, prompts, completions, costs = pro_td, pro_prompt, pro_completion, pro_cost
+                else:
+                    durations, prompts, completions, costs = con_td, con_prompt, con_completion, con_cost
+                if t.duration_ms is not None:
+                    durations.append(t.duration_ms)
+                if t.prompt_tokens is not None:
+                    prompts.append(t.prompt_tokens)
+                if t.completion_tokens is not None:
+                    completions.append(t.completion_tokens)
+                if t.cost is not None:
+                    costs.append(t.cost)
+
+            # Judge agreement (winner label agreement), side preference, majority alignment
+            winners = {j.judge_id: j.winner for j in d.judges}
+            for j_id, win in winners.items():
+                jt[j_id] = jt.get(j_id, 0) + 1
+                if win == majority:
+                    jm[j_id] = jm.get(j_id, 0) + 1
+                if win in ("pro", "con", "tie"):
+                    counts = judge_winner_counts.get(j_id) or judge_winner_counts.setdefault(
+                        j_id, {"pro": 0, "con": 0, "tie": 0}
+                    )
+                    counts[win] += 1
+            # Canonical (sorted) pair keys so (a, b) and (b, a) share one counter.
+            for k in combinations(sorted(winners), 2):
+                pt[k] = pt.get(k, 0) + 1
+                pa[k] = pa.get(k, 0) + (winners[k[0]] == winners[k[1]])
+        gap_writer.writerows(batch)
+
+    # Winner counts
+    with _open_csv(out_dir / "winner_counts.csv") as f:
         writer = csv.writer(f)
         writer.writerow(["winner", "count"])
-        for k in ("pro", "con", "tie"):
-            writer.writerow([k, win_counts.get(k, 0)])
+        writer.writerows((k, win_counts.get(k, 0)) for k in ("pro", "con", "tie"))
 
     # Topic win rates
-    topic_stats = defaultdict(lambda: defaultdict(int))
-    for d in debates:
-        t = d.transcript.topic.id
-        topic_stats[t][d.aggregate.winner] += 1
-    with (out_dir / "topic_winrate.csv").open("w", newline="", encoding="utf-8") as f:
+    with _open_csv(out_dir / "topic_winrate.csv") as f:
         writer = csv.writer(f)
         writer.writerow(["topic_id", "pro_wins", "con_wins", "ties", "total"])
+        rows = []
         for topic_id, stats in sorted(topic_stats.items()):
             pro = stats.get("pro", 0)
             con = stats.get("con", 0)
             tie = stats.get("tie", 0)
-            total = pro + con + tie
-            writer.writerow([topic_id, pro, con, tie, total])
+            rows.append([topic_id, pro, con, tie, pro + con + tie])
+        writer.writerows(rows)
 
     # Per-model per-dimension averages (by side)
-    # We attribute mean_pro scores to pro_model_id, mean_con to con_model_id.
-    dim_sums = defaultdict(lambda: defaultdict(float))
-    dim_counts = defaultdict(lambda: defaultdict(int))
-    turn_duration = defaultdict(lambda: {"pro": [], "con": []})
-    token_usage = defaultdict(lambda: {"pro_prompt": [], "pro_completion": [], "con_prompt": [], "con_completion": []})
-    cost_usage = defaultdict(lambda: {"pro_cost": [], "con_cost": []})
-    for d in debates:
-        pro_id = d.transcript.pro_model_id
-        con_id = d.transcript.con_model_id
-        for dim, score in d.aggregate.mean_pro.items():
-            dim_sums[pro_id][dim] += score
-            dim_counts[pro_id][dim] += 1
-        for dim, score in d.aggregate.mean_con.items():
-            dim_sums[con_id][dim] += score
-            dim_counts[con_id][dim] += 1
-        # accumulate timing and token usage
-        for t in d.transcript.turns:
-            side = "pro" if t.speaker == "pro" else "con"
-            model_id = pro_id if side == "pro" else con_id
-            if t.duration_ms is not None:
-                turn_duration[model_id][side].append(t.duration_ms)
-            if t.prompt_tokens is not None:
-                key = f"{side}_prompt"
-                token_usage[model_id][key].append(t.prompt_tokens)
-            if t.completion_tokens is not None:
-                key = f"{side}_completion"
-                token_usage[model_id][key].append(t.completion_tokens)
-            if t.cost is not None:
-                key = f"{side}_cost"
-                cost_usage[model_id][key].append(t.cost)
-    with (out_dir / "model_dimension_avg.csv").open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["model_id", "dimension", "mean_score", "samples"])
-        for model_id in sorted(dim_sums.keys()):
-            for dim, total in dim_sums[model_id].items():
-                cnt = dim_counts[model_id][dim]
-                mean = total / cnt if cnt else 0.0
-                writer.writerow([model_id, dim, f"{mean:.4f}", cnt])
+    dim_df = pd.DataFrame(dim_rows, columns=["model_id", "dimension", "score"])
+    # Models sorted, dimensions in first-seen (rubric) order within each model.
+    dim_avg = (
+        dim_df.groupby(["model_id", "dimension"], sort=False)["score"]
+        .agg(mean_score="mean", samples="count")
+        .reset_index()
+        .sort_values("model_id", kind="stable")
+    )
+    dim_avg.to_csv(
+        out_dir / "model_dimension_avg.csv", index=False, float_format="%.4f", lineterminator="\r\n"
+    )
 
     # Turn timing per model side
-    with (out_dir / "turn_timings.csv").open("w", newline="", encoding="utf-8") as f:
+    with _open_csv(out_dir / "turn_timings.csv") as f:
         writer = csv.writer(f)
         writer.writerow(["model_id", "side", "mean_ms", "samples"])
-        for model_id, buckets in sorted(turn_duration.items()):
+        rows = []
+        for model_id, buckets in sorted(_observed(turn_duration)):
             for side in ("pro", "con"):
                 arr = buckets[side]
                 mean = sum(arr) / len(arr) if arr else 0.0
-                writer.writerow([model_id, side, f"{mean:.2f}", len(arr)])
+                rows.append([model_id, side, f"{mean:.2f}", len(arr)])
+        writer.writerows(rows)
 
     # Token usage per model side
-    with (out_dir / "token_usage.csv").open("w", newline="", encoding="utf-8") as f:
+    with _open_csv(out_dir / "token_usage.csv") as f:
         writer = csv.writer(f)
         writer.writerow(["model_id", "side", "mean_prompt_tokens", "mean_completion_tokens", "samples"])
-        for model_id, buckets in sorted(token_usage.items()):
+        rows = []
+        for model_id, buckets in sorted(_observed(token_usage)):
             for side in ("pro", "con"):
                 pkey = f"{side}_prompt"
                 ckey = f"{side}_completion"
@@ -129,52 +218,36 @@ def summarize(
                 cnt = max(len(pvals), len(cvals), 0)
                 mp = sum(pvals) / len(pvals) if pvals else 0.0
                 mc = sum(cvals) / len(cvals) if cvals else 0.0
-                writer.writerow([model_id, side, f"{mp:.2f}", f"{mc:.2f}", cnt])
+                rows.append([model_id, side, f"{mp:.2f}", f"{mc:.2f}", cnt])
+        writer.writerows(rows)
 
     # Cost usage per model side (observed from OpenRouter usage, if present)
-    with (out_dir / "cost_usage.csv").open("w", newline="", encoding="utf-8") as f:
+    with _open_csv(out_dir / "cost_usage.csv") as f:
         writer = csv.writer(f)
         writer.writerow(["model_id", "side", "mean_cost_usd", "samples"])
-        for model_id, buckets in sorted(cost_usage.items()):
+        rows = []
+        for model_id, buckets in sorted(_observed(cost_usage)):
             for side in ("pro", "con"):
                 key = f"{side}_cost"
                 vals = buckets[key]
                 cnt = len(vals)
                 mean_cost = sum(vals) / cnt if cnt else 0.0
-                writer.writerow([model_id, side, f"{mean_cost:.6f}", cnt])
+                rows.append([model_id, side, f"{mean_cost:.6f}", cnt])
+        writer.writerows(rows)
 
     # Judge agreement matrix (winner label agreement)
-    pair_agree = defaultdict(int)
-    pair_total = defaultdict(int)
-    judge_match_majority = defaultdict(int)
-    judge_total = defaultdict(int)
-    judge_winner_counts = defaultdict(lambda: {"pro": 0, "con": 0, "tie": 0})
-    for d in debates:
-        winners = {j.judge_id: j.winner for j in d.judges}
-        ids = list(winners.keys())
-        majority = d.aggregate.winner
-        for j_id, win in winners.items():
-            judge_total[j_id] += 1
-            if win == majority:
-                judge_match_majority[j_id] += 1
-            if win in ("pro", "con", "tie"):
-                judge_winner_counts[j_id][win] += 1
-        for i in range(len(ids)):
-            for j in range(i + 1, len(ids)):
-                a, b = ids[i], ids[j]
-                pair_total[(a, b)] += 1
-                if winners[a] == winners[b]:
-                    pair_agree[(a, b)] += 1
-    with (out_dir / "judge_agreement.csv").open("w", newline="", encoding="utf-8") as f:
+    with _open_csv(out_dir / "judge_agreement.csv") as f:
         writer = csv.writer(f)
         writer.writerow(["judge_a", "judge_b", "agree", "total", "agreement_rate"])
+        rows = []
         for (a, b), tot in sorted(pair_total.items()):
-            agree = pair_agree.get((a, b), 0)
+            agree = pair_agree[(a, b)]
             rate = agree / tot if tot else 0.0
-            writer.writerow([a, b, agree, tot, f"{rate:.4f}"])
+            rows.append([a, b, agree, tot, f"{rate:.4f}"])
+        writer.writerows(rows)
 
     # Judge side preference (per-judge pro/con/tie rates)
-    with (out_dir / "judge_side_preference.csv").open("w", newline="", encoding="utf-8") as f:
+    with _open_csv(out_dir / "judge_side_preference.csv") as f:
         writer = csv.writer(f)
         writer.writerow(
             [
@@ -188,6 +261,7 @@ def summarize(
                 "tie_rate",
             ]
         )
+        rows = []
         for j_id, counts in sorted(judge_winner_counts.items()):
             total = sum(counts.values())
             pro = counts["pro"]
@@ -196,7 +270,7 @@ def summarize(
             pro_rate = pro / total if total else 0.0
             con_rate = con / total if total else 0.0
             tie_rate = tie / total if total else 0.0
-            writer.writerow(
+            rows.append(
                 [
                     j_id,
                     pro,
@@ -208,45 +282,27 @@ def summarize(
                     f"{tie_rate:.4f}",
                 ]
             )
+        writer.writerows(rows)
 
     # Judge majority alignment
-    with (out_dir / "judge_majority_alignment.csv").open("w", newline="", encoding="utf-8") as f:
+    with _open_csv(out_dir / "judge_majority_alignment.csv") as f:
         writer = csv.writer(f)
         writer.writerow(["judge_id", "matches_majority", "total", "alignment_rate"])
+        rows = []
         for j_id, tot in sorted(judge_total.items()):
             match = judge_match_majority.get(j_id, 0)
             rate = match / tot if tot else 0.0
-            writer.writerow([j_id, match, tot, f"{rate:.4f}"])
+            rows.append([j_id, match, tot, f"{rate:.4f}"])
+        writer.writerows(rows)
 
     # Model winrate by side
-    side_stats = defaultdict(lambda: {"pro_w":0,"pro_l":0,"pro_t":0,"con_w":0,"con_l":0,"con_t":0})
-    for d in debates:
-        pro = d.transcript.pro_model_id
-        con = d.transcript.con_model_id
-        winner = d.aggregate.winner
-        if winner == "pro":
-            side_stats[pro]["pro_w"] += 1
-            side_stats[con]["con_l"] += 1
-        elif winner == "con":
-            side_stats[pro]["pro_l"] += 1
-            side_stats[con]["con_w"] += 1
-        else:
-            side_stats[pro]["pro_t"] += 1
-            side_stats[con]["con_t"] += 1
-    with (out_dir / "model_winrate_by_side.csv").open("w", newline="", encoding="utf-8") as f:
+    with _open_csv(out_dir / "model_winrate_by_side.csv") as f:
         writer = csv.writer(f)
         writer.writerow(["model_id","pro_w","pro_l","pro_t","con_w","con_l","con_t"])
-        for m_id, stats in sorted(side_stats.items()):
-            writer.writerow([m_id, stats["pro_w"], stats["pro_l"], stats["pro_t"], stats["con_w"], stats["con_l"], stats["con_t"]])
-
-    # Dimension score gaps per debate (mean_pro - mean_con)
-    with (out_dir / "dimension_score_gaps.csv").open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["debate_id", "dimension", "gap"])
-        for d in debates:
-            for dim, pro_score in d.aggregate.mean_pro.items():
-                con_score = d.aggregate.mean_con.get(dim, 0.0)
-                writer.writerow([d.transcript.debate_id, dim, pro_score - con_score])
+        writer.writerows(
+            [m_id, stats["pro_w"], stats["pro_l"], stats["pro_t"], stats["con_w"], stats["con_l"], stats["con_t"]]
+            for m_id, stats in sorted(side_stats.items())
+        )
 
     console.print(f"[green]Wrote summaries to {out_dir}")
 
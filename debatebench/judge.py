@@ -7,6 +7,7 @@ import json
 import yaml
 import re
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, List, Tuple, Optional
 
 from .models import JudgeAdapter
@@ -227,13 +228,18 @@ def run_single_judge(
     ]
 
     last_error: Optional[Exception] = None
+    prompts: Dict[Tuple[bool, Optional[str]], str] = {}
     for attempt in attempts:
-        prompt = _build_judge_prompt(
-            transcript,
-            config,
-            reinforce_json=attempt["reinforce_json"],
-            template_hint=attempt["template"],
-        )
+        # Attempts usually differ only in response format; build each distinct prompt once.
+        prompt_key = (attempt["reinforce_json"], attempt["template"])
+        prompt = prompts.get(prompt_key)
+        if prompt is None:
+            prompt = prompts[prompt_key] = _build_judge_prompt(
+                transcript,
+                config,
+                reinforce_json=attempt["reinforce_json"],
+                template_hint=attempt["template"],
+            )
         t0 = time.perf_counter()
         try:
             raw, usage = adapter.judge(
@@ -345,7 +351,9 @@ def run_judge_panel(
     """
     Try candidates in order until `expected` valid judge results are collected.
     Falls back through the remaining candidates; raises if we cannot reach the
-    target count.
+    target count. The first `expected` candidates are judged concurrently and each
+    failure launches the next fallback, so the accepted judges (and their order)
+    match a sequential pass.
     """
     rng = None
     if seed is not None:
@@ -358,34 +366,52 @@ def run_judge_panel(
         tie = rng.random() if rng else 0.0
         return (count, tie, adapter.config.id)
 
-    queue = sorted(candidate_adapters, key=sort_key)
-    results: List[JudgeResult] = []
+    queue: List[JudgeAdapter] = []
     tried: set[str] = set()
-
-    for adapter in queue:
-        if adapter.config.id in tried:
-            continue
-        tried.add(adapter.config.id)
-        try:
-            res = run_single_judge(adapter, transcript, config)
-            results.append(res)
-            if progress_hook:
-                progress_hook(len(results), expected, adapter.config.id)
-            if usage is not None:
-                usage[adapter.config.id] = usage.get(adapter.config.id, 0) + 1
-        except Exception as e:
-            if log:
-                log(f"[yellow]Judge {adapter.config.id} dropped: {e}[/yellow]")
-            if failed_judges_sink:
-                failed_judges_sink(
-                    {
-                        "judge_id": adapter.config.id,
-                        "error": str(e),
-                    }
-                )
-            continue
-        if len(results) >= expected:
-            break
+    for adapter in sorted(candidate_adapters, key=sort_key):
+        if adapter.config.id not in tried:
+            tried.add(adapter.config.id)
+            queue.append(adapter)
+
+    # Results keyed by queue position; hooks, usage and logging stay on this thread.
+    accepted: Dict[int, JudgeResult] = {}
+    next_pos = 0
+    with ThreadPoolExecutor(max_workers=max(1, expected)) as pool:
+        inflight = {}
+
+        def top_up() -> None:
+            nonlocal next_pos
+            while next_pos < len(queue) and len(accepted) + len(inflight) < expected:
+                adapter = queue[next_pos]
+                inflight[pool.submit(run_single_judge, adapter, transcript, config)] = (next_pos, adapter)
+                next_pos += 1
+
+        top_up()
+        while inflight:
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                pos, adapter = inflight.pop(fut)
+                try:
+                    res = fut.result()
+                except Exception as e:
+                    if log:
+                        log(f"[yellow]Judge {adapter.config.id} dropped: {e}[/yellow]")
+                    if failed_judges_sink:
+                        failed_judges_sink(
+                            {
+                                "judge_id": adapter.config.id,
+                                "error": str(e),
+                            }
+                        )
+                    continue
+                accepted[pos] = res
+                if progress_hook:
+                    progress_hook(len(accepted), expected, adapter.config.id)
+                if usage is not None:
+                    usage[adapter.config.id] = usage.get(adapter.config.id, 0) + 1
+            top_up()
+
+    results = [accepted[pos] for pos in sorted(accepted)]
 
     if len(results) < expected:
         raise RuntimeError(f"Collected {len(results)} of {expected} judges.")
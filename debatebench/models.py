@@ -7,9 +7,9 @@ import time
 import threading
 from typing import Dict, List, Optional
 
-import requests
 from requests import exceptions as req_exc
 
+from .openrouter import get_openrouter_session
 from .schema import DebaterModelConfig, JudgeModelConfig, Turn
 from .settings import Settings
 
@@ -224,7 +224,8 @@ class OpenRouterAdapter(ModelAdapter):
             try:
                 if self._rate_limiter is not None:
                     self._rate_limiter.acquire()
-                resp = requests.post(
+                # Shared keep-alive pool: adapters are rebuilt per run, connections are not.
+                resp = get_openrouter_session().post(
                     self.config.endpoint,
                     headers=self._headers(),
                     json=payload,
@@ -3,11 +3,70 @@ Helpers for interacting with the OpenRouter model catalog.
 """
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
 import requests
 from requests import exceptions as req_exc
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+CATALOG_CACHE_DIR = Path.home() / ".cache" / "debatebench"
+
+_SESSION: Optional[requests.Session] = None
+_POOL_MAXSIZE = 64
+
+
+def _mount_adapter(session: requests.Session, pool_maxsize: int) -> None:
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def get_openrouter_session() -> requests.Session:
+    """
+    Process-wide keep-alive session for OpenRouter calls, so the catalog fetch, probes
+    and debate/judge requests reuse pooled TLS connections instead of handshaking per
+    request. The pool holds 64 connections per host unless a run raises it through
+    `configure_openrouter_pool`.
+
+    Transport-level retries: failed connects are retried for every method (nothing was
+    sent yet); 429/5xx and read errors only for GET, because POSTs are not idempotent
+    and the model adapters run their own retry loop.
+    """
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        _mount_adapter(session, _POOL_MAXSIZE)
+        _SESSION = session
+    return _SESSION
+
+
+def configure_openrouter_pool(max_concurrent_requests: int) -> None:
+    """
+    Grow the shared session's per-host pool to hold `max_concurrent_requests` connections
+    (never shrinks below the default). Call before fanning out requests; requests beyond
+    the pool size still work but open a fresh connection each time.
+    """
+    global _POOL_MAXSIZE
+    if max_concurrent_requests <= _POOL_MAXSIZE:
+        return
+    _POOL_MAXSIZE = max_concurrent_requests
+    if _SESSION is not None:
+        _mount_adapter(_SESSION, _POOL_MAXSIZE)
 
 
 def fetch_recent_openrouter_models(
@@ -15,6 +74,7 @@ def fetch_recent_openrouter_models(
     api_key: str,
     site_url: Optional[str] = None,
     site_name: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> List[Dict]:
     """
     Fetch the OpenRouter model catalog and return entries created within the last `months`.
@@ -34,7 +94,7 @@ def fetch_recent_openrouter_models(
         headers["X-Title"] = site_name
 
     try:
-        resp = requests.get(url, headers=headers, timeout=60)
+        resp = (session or get_openrouter_session()).get(url, headers=headers, timeout=60)
         resp.raise_for_status()
     except req_exc.RequestException as e:
         raise RuntimeError(f"Failed to fetch OpenRouter models: {e}") from e
@@ -72,12 +132,59 @@ def fetch_recent_openrouter_models(
     return filtered
 
 
+def _catalog_cache_path(months: int, api_key: str) -> Path:
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return CATALOG_CACHE_DIR / f"openrouter_models_{months}_{key_hash}.json"
+
+
+def cached_fetch_recent_openrouter_models(
+    months: int,
+    api_key: str,
+    site_url: Optional[str] = None,
+    site_name: Optional[str] = None,
+    ttl_s: float = 3600.0,
+    refresh: bool = False,
+) -> List[Dict]:
+    """
+    Same as `fetch_recent_openrouter_models`, but reuse an on-disk copy of the filtered
+    catalog if it is younger than `ttl_s` seconds. `refresh=True` forces a fetch (and
+    rewrites the cache); `ttl_s <= 0` disables caching entirely.
+    """
+    if not api_key or ttl_s <= 0:
+        return fetch_recent_openrouter_models(months, api_key, site_url, site_name)
+
+    path = _catalog_cache_path(months, api_key)
+    if not refresh:
+        try:
+            if time.time() - path.stat().st_mtime < ttl_s:
+                entries = json.loads(path.read_text(encoding="utf-8"))
+                for entry in entries:
+                    entry["created"] = datetime.fromisoformat(entry["created"])
+                return entries
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # missing or unreadable cache: fall through to a live fetch
+
+    entries = fetch_recent_openrouter_models(months, api_key, site_url, site_name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps([{**e, "created": e["created"].isoformat()} for e in entries]),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+    except OSError:
+        pass  # cache is best-effort
+    return entries
+
+
 def probe_model(
     model_id: str,
     api_key: str,
     site_url: Optional[str] = None,
     site_name: Optional[str] = None,
     timeout: float = 30.0,
+    session: Optional[requests.Session] = None,
 ) -> Optional[str]:
     """
     Send a minimal 1-token request to verify the model is usable.
@@ -102,10 +209,34 @@ def probe_model(
     }
 
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=timeout)
+        resp = (session or get_openrouter_session()).post(url, headers=headers, json=payload, timeout=timeout)
     except req_exc.RequestException as e:
         return str(e)
 
     if resp.status_code == 200:
         return None
     return resp.text or f"HTTP {resp.status_code}"
+
+
+def probe_models_concurrent(
+    model_ids: Iterable[str],
+    api_key: str,
+    site_url: Optional[str] = None,
+    site_name: Optional[str] = None,
+    max_concurrency: int = 16,
+) -> Dict[str, Optional[str]]:
+    """
+    Run `probe_model` for every id on a bounded thread pool (the calls are independent
+    and network-bound). Returns {model_id: error_or_None}; the pool size caps in-flight requests.
+    """
+    ids = list(dict.fromkeys(model_ids))
+    if not ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(ids)))) as pool:
+        errors = pool.map(
+            lambda model_id: probe_model(
+                model_id=model_id, api_key=api_key, site_url=site_url, site_name=site_name
+            ),
+            ids,
+        )
+        return dict(zip(ids, errors))
@@ -0,0 +1,358 @@
+"""
+Plot renderers behind `debatebench plot`.
+
+Importing this module loads matplotlib/seaborn/pandas, so the CLI only imports
+it from inside the plot command.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from .plot_style import apply_dark_theme, style_axes
+
+# Fast zlib level and no Software tEXt chunk: plots are regenerated every run, size matters little.
+PNG_SAVE_KWARGS = {"pil_kwargs": {"compress_level": 1}, "metadata": {"Software": None}}
+
+# Columns each plot reads from the summarize CSVs, with fixed dtypes (skips inference).
+# Labels stay plain str, not category: seaborn would reorder bars by category order.
+CSV_SCHEMAS = {
+    "winner_counts.csv": {"winner": str, "count": "int64"},
+    "topic_winrate.csv": {"topic_id": str, "pro_wins": "int64", "con_wins": "int64", "ties": "int64"},
+    "model_dimension_avg.csv": {"model_id": str, "dimension": str, "mean_score": "float64"},
+    "judge_agreement.csv": {"judge_a": str, "judge_b": str, "agreement_rate": "float64"},
+    "judge_majority_alignment.csv": {"judge_id": str, "alignment_rate": "float64"},
+    "judge_side_preference.csv": {
+        "judge_id": str,
+        "pro_rate": "float64",
+        "con_rate": "float64",
+        "tie_rate": "float64",
+    },
+    "model_winrate_by_side.csv": {"model_id": str, "pro_w": "int64", "con_w": "int64"},
+    "dimension_score_gaps.csv": {"dimension": str, "gap": "float64"},
+    "turn_timings.csv": {"model_id": str, "side": str, "mean_ms": "float64"},
+    "token_usage.csv": {
+        "model_id": str,
+        "side": str,
+        "mean_prompt_tokens": "float64",
+        "mean_completion_tokens": "float64",
+    },
+    "cost_usage.csv": {"model_id": str, "side": str, "mean_cost_usd": "float64"},
+}
+
+# Heatmaps above this many cells skip per-cell text (one Text artist each) and rely on the colorbar.
+MAX_ANNOTATED_CELLS = 400
+
+
+@lru_cache(maxsize=16)
+def _read_summary_csv(path: str, mtime_ns: int, name: str) -> pd.DataFrame:
+    # mtime_ns is part of the cache key so a regenerated CSV is re-parsed.
+    schema = CSV_SCHEMAS[name]
+    return pd.read_csv(path, usecols=list(schema), dtype=schema, engine="c")
+
+
+class PlotContext:
+    """Per-process plotting state: themed palettes and one Figure reused across panels."""
+
+    def __init__(self, viz_dir: Path, out_dir: Path):
+        self.viz_dir = viz_dir
+        self.out_dir = out_dir
+        self.palettes = apply_dark_theme()
+        # Resolve hex palette entries to RGB once; the bar fills also get barplot's
+        # default 0.75 saturation baked in so panels don't redo it per bar.
+        self.seq = list(sns.color_palette(self.palettes["seq"]))
+        self.seq_bars = [sns.desaturate(c, 0.75) for c in self.seq]
+        self.fig = plt.figure()
+        self.default_size = tuple(plt.rcParams["figure.figsize"])
+
+    def new_axes(self, figsize=None):
+        self.fig.clear()
+        self.fig.set_size_inches(*(figsize or self.default_size))
+        return self.fig.add_subplot(111)
+
+    def has(self, name: str) -> bool:
+        return (self.viz_dir / name).exists()
+
+    def read(self, name: str) -> pd.DataFrame:
+        path = self.viz_dir / name
+        # Copy so panels can't mutate the cached frame.
+        return _read_summary_csv(str(path), path.stat().st_mtime_ns, name).copy()
+
+    def save(self, name: str) -> None:
+        self.fig.tight_layout()
+        self.fig.savefig(self.out_dir / name, **PNG_SAVE_KWARGS)
+
+    def close(self) -> None:
+        plt.close(self.fig)
+
+
+def _as_categories(df: pd.DataFrame, *cols: str) -> pd.DataFrame:
+    """
+    Cast label columns to categoricals ordered by first appearance, so seaborn
+    groups on integer codes while keeping the CSV's bar order.
+    """
+    return df.astype({c: pd.CategoricalDtype(pd.unique(df[c])) for c in cols})
+
+
+def _category_bars(ax, labels: pd.Series, values: pd.Series, colors) -> None:
+    """
+    One pre-aggregated bar per category, drawn like sns.barplot(hue=x) without
+    seaborn's grouping/error-bar pass.
+    """
+    # colors are pre-desaturated (ctx.seq_bars) so fills match the seaborn version.
+    fills = [colors[i % len(colors)] for i in range(len(labels))]
+    ax.bar(np.arange(len(labels)), values.to_numpy(), width=0.8, color=fills)
+    ax.set_xticks(np.arange(len(labels)), labels.tolist())
+    ax.set_xlim(-0.5, len(labels) - 0.5)
+    ax.set_xlabel(labels.name)
+    ax.set_ylabel(values.name)
+
+
+def plot_winner_counts(ctx: PlotContext) -> None:
+    df = ctx.read("winner_counts.csv")
+    ax = ctx.new_axes()
+    _category_bars(ax, df["winner"], df["count"], ctx.seq_bars)
+    ax.set_title("Winner Distribution")
+    style_axes(ax)
+    ctx.save("winner_counts.png")
+
+
+def plot_topic_winrate(ctx: PlotContext) -> None:
+    df = ctx.read("topic_winrate.csv").set_index("topic_id")[["pro_wins", "con_wins", "ties"]]
+    ax = ctx.new_axes(figsize=(8, 4))
+    df.plot(kind="bar", stacked=True, ax=ax, color=ctx.seq[:3])
+    ax.set_ylabel("Count")
+    ax.set_title("Wins by Topic")
+    style_axes(ax)
+    ctx.save("topic_winrate.png")
+
+
+def plot_model_dimension_heatmap(ctx: PlotContext) -> None:
+    df = ctx.read("model_dimension_avg.csv")
+    pivot = df.pivot(index="model_id", columns="dimension", values="mean_score")
+    ax = ctx.new_axes(figsize=(6, 3 + 0.4 * len(pivot)))
+    sns.heatmap(
+        pivot,
+        annot=pivot.size <= MAX_ANNOTATED_CELLS,
+        fmt=".2f",
+        cmap=ctx.palettes["seq_cmap"],
+        ax=ax,
+        annot_kws={"color": "#e9eef7", "fontsize": 9},
+    )
+    ax.set_title("Per-Model Dimension Averages")
+    ctx.save("model_dimension_heatmap.png")
+
+
+def plot_judge_agreement(ctx: PlotContext) -> None:
+    df = ctx.read("judge_agreement.csv")
+    judges = sorted(set(df.judge_a).union(df.judge_b))
+    pos = {j: i for i, j in enumerate(judges)}
+    a = df["judge_a"].map(pos).to_numpy()
+    b = df["judge_b"].map(pos).to_numpy()
+    rate = df["agreement_rate"].to_numpy()
+    # Unseen pairs and the diagonal read as full agreement; mirrored cells are written
+    # first so a directly recorded (a, b) rate wins over its transpose.
+    arr = np.ones((len(judges), len(judges)))
+    arr[b, a] = rate
+    arr[a, b] = rate
+    np.fill_diagonal(arr, 1.0)
+    mat = pd.DataFrame(arr, index=judges, columns=judges)
+    ax = ctx.new_axes(figsize=(4 + 0.4 * len(judges), 4 + 0.4 * len(judges)))
+    sns.heatmap(
+        mat,
+        annot=mat.size <= MAX_ANNOTATED_CELLS,
+        fmt=".2f",
+        cmap=ctx.palettes["seq_cmap"],
+        vmin=0,
+        vmax=1,
+        ax=ax,
+        annot_kws={"color": "#e9eef7", "fontsize": 9},
+    )
+    ax.set_title("Judge Winner Agreement")
+    ctx.save("judge_agreement.png")
+
+
+def plot_judge_majority_alignment(ctx: PlotContext) -> None:
+    df = ctx.read("judge_majority_alignment.csv")
+    ax = ctx.new_axes()
+    _category_bars(ax, df["judge_id"], df["alignment_rate"], ctx.seq_bars)
+    ax.set_title("Judge vs Panel Majority")
+    ax.set_ylim(0, 1)
+    style_axes(ax)
+    ctx.save("judge_majority_alignment.png")
+
+
+def plot_judge_side_preference(ctx: PlotContext) -> None:
+    """Pro/con/tie rate per judge (skipped when the CSV is absent)."""
+    if not ctx.has("judge_side_preference.csv"):
+        return
+    df = ctx.read("judge_side_preference.csv")
+    df = df.set_index("judge_id")[["pro_rate", "con_rate", "tie_rate"]]
+    ax = ctx.new_axes(figsize=(8, 2 + 0.35 * len(df)))
+    df.plot(kind="barh", stacked=True, ax=ax, color=ctx.seq[:3])
+    ax.set_title("Judge Side Preference (Rates)")
+    ax.set_xlabel("Rate")
+    ax.set_xlim(0, 1)
+    style_axes(ax)
+    ctx.save("judge_side_preference.png")
+
+
+def plot_model_winrate_by_side(ctx: PlotContext) -> None:
+    df = ctx.read("model_winrate_by_side.csv")
+    melt = df.rename(columns={"pro_w": "pro", "con_w": "con"}).melt(
+        id_vars="model_id", value_vars=["pro", "con"], var_name="side", value_name="wins"
+    )
+    melt = _as_categories(melt, "model_id", "side")
+    ax = ctx.new_axes(figsize=(8, 4 + 0.3 * len(df)))
+    sns.barplot(
+        x="wins",
+        y="model_id",
+        hue="side",
+        data=melt,
+        orient="h",
+        errorbar=None,
+        ax=ax,
+        palette=ctx.seq[: melt["side"].nunique()],
+    )
+    ax.set_title("Wins by Side per Model")
+    style_axes(ax)
+    ctx.save("model_winrate_by_side.png")
+
+
+def plot_dimension_score_gaps(ctx: PlotContext) -> None:
+    df = _as_categories(ctx.read("dimension_score_gaps.csv"), "dimension")
+    ax = ctx.new_axes(figsize=(8, 4))
+    sns.boxplot(
+        x="dimension",
+        y="gap",
+        data=df,
+        hue="dimension",
+        legend=False,
+        palette=ctx.seq[: df["dimension"].nunique()],
+        ax=ax,
+    )
+    ax.axhline(0, color="black", linewidth=1)
+    ax.set_title("Score Gap (PRO minus CON) per Dimension")
+    style_axes(ax)
+    ctx.save("dimension_score_gaps.png")
+
+
+def plot_turn_timings(ctx: PlotContext) -> None:
+    df = _as_categories(ctx.read("turn_timings.csv"), "model_id", "side")
+    ax = ctx.new_axes(figsize=(8, 4 + 0.2 * len(df)))
+    sns.barplot(
+        x="mean_ms",
+        y="model_id",
+        hue="side",
+        data=df,
+        orient="h",
+        errorbar=None,
+        ax=ax,
+        palette=ctx.seq[: df["side"].nunique()],
+    )
+    ax.set_title("Mean Turn Duration (ms) by Model and Side")
+    style_axes(ax)
+    ctx.save("turn_timings.png")
+
+
+def plot_token_usage(ctx: PlotContext) -> None:
+    df = ctx.read("token_usage.csv")
+    ids = df[["model_id", "side"]]
+    melt = pd.concat(
+        [
+            ids.assign(kind="mean_prompt_tokens", tokens=df["mean_prompt_tokens"].to_numpy()),
+            ids.assign(kind="mean_completion_tokens", tokens=df["mean_completion_tokens"].to_numpy()),
+        ],
+        ignore_index=True,
+    )
+    melt = _as_categories(melt, "model_id", "kind")
+    ax = ctx.new_axes(figsize=(8, 4 + 0.2 * len(df)))
+    sns.barplot(
+        x="tokens",
+        y="model_id",
+        hue="kind",
+        data=melt,
+        orient="h",
+        ax=ax,
+        palette=ctx.seq[: melt["kind"].nunique()],
+    )
+    ax.set_title("Mean Token Usage by Model and Side")
+    style_axes(ax)
+    ctx.save("token_usage.png")
+
+
+def plot_cost_usage(ctx: PlotContext) -> None:
+    """Mean observed cost per model side (skipped when the CSV is absent)."""
+    if not ctx.has("cost_usage.csv"):
+        return
+    df = _as_categories(ctx.read("cost_usage.csv"), "model_id", "side")
+    ax = ctx.new_axes(figsize=(8, 4 + 0.2 * len(df)))
+    sns.barplot(
+        x="mean_cost_usd",
+        y="model_id",
+        hue="side",
+        data=df,
+        orient="h",
+        errorbar=None,
+        ax=ax,
+        palette=ctx.seq[: df["side"].nunique()],
+    )
+    ax.set_title("Mean Observed Cost (USD) by Model and Side")
+    style_axes(ax)
+    ctx.save("cost_usage.png")
+
+
+PLOTS = (
+    plot_winner_counts,
+    plot_topic_winrate,
+    plot_model_dimension_heatmap,
+    plot_judge_agreement,
+    plot_judge_majority_alignment,
+    plot_judge_side_preference,
+    plot_model_winrate_by_side,
+    plot_dimension_score_gaps,
+    plot_turn_timings,
+    plot_token_usage,
+    plot_cost_usage,
+)
+
+_worker_ctx: PlotContext | None = None
+
+
+def _init_worker(viz_dir: Path, out_dir: Path) -> None:
+    # rcParams are per-process, so each worker applies the theme itself.
+    global _worker_ctx
+    _worker_ctx = PlotContext(viz_dir, out_dir)
+
+
+def _render(plot) -> None:
+    plot(_worker_ctx)
+
+
+def render_all(viz_dir: Path, out_dir: Path, max_workers: int | None = None) -> None:
+    """Render every panel; independent panels are spread across worker processes."""
+    workers = max_workers or min(len(PLOTS), os.cpu_count() or 1)
+    if workers <= 1:
+        ctx = PlotContext(viz_dir, out_dir)
+        try:
+            for plot in PLOTS:
+                plot(ctx)
+        finally:
+            ctx.close()
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(viz_dir, out_dir)
+    ) as pool:
+        # Consume results so the first failing panel raises here.
+        for _ in pool.map(_render, PLOTS):
+            pass
+
+
+__all__ = ["PLOTS", "PlotContext", "render_all"]
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import math
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Tuple
 
 from .schema import DebateRecord, EloConfig, MainConfig, RatingEntry, RatingsFile
 
@@ -20,21 +20,34 @@ def update_elo(r_a: float, r_b: float, score_a: float, k: float) -> Tuple[float,
     return r_a + delta_a, r_b - delta_a
 
 
-def recompute_ratings(debates: List[DebateRecord], config: MainConfig) -> RatingsFile:
+def recompute_ratings(debates: Iterable[DebateRecord], config: MainConfig) -> RatingsFile:
+    """
+    Replay debates in (created_at, debate_id) order to rebuild Elo ratings and
+    per-dimension averages. Accepts any iterable, so callers can stream records;
+    only the fields needed for rating are retained while sorting.
+    """
     elo_cfg: EloConfig = config.elo
     ratings: Dict[str, float] = defaultdict(lambda: elo_cfg.initial_rating)
     games_played: Dict[str, int] = defaultdict(int)
     dim_sums: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
     dim_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
 
-    # Sort debates deterministically by creation time then id
-    debates_sorted = sorted(debates, key=lambda d: (d.created_at, d.transcript.debate_id))
-
-    for record in debates_sorted:
-        pro = record.transcript.pro_model_id
-        con = record.transcript.con_model_id
-        winner = record.aggregate.winner
+    # Keep only rating inputs (not transcripts), sorted by creation time then id
+    games = [
+        (
+            d.created_at,
+            d.transcript.debate_id,
+            d.transcript.pro_model_id,
+            d.transcript.con_model_id,
+            d.aggregate.winner,
+            d.aggregate.mean_pro,
+            d.aggregate.mean_con,
+        )
+        for d in debates
+    ]
+    games.sort(key=lambda g: (g[0], g[1]))
 
+    for _created_at, _debate_id, pro, con, winner, mean_pro, mean_con in games:
         if winner == "pro":
             score_pro = 1.0
         elif winner == "con":
@@ -49,10 +62,10 @@ def recompute_ratings(debates: List[DebateRecord], config: MainConfig) -> Rating
         games_played[con] += 1
 
         # accumulate dimension means for each side
-        for dim, score in record.aggregate.mean_pro.items():
+        for dim, score in mean_pro.items():
             dim_sums[pro][dim] += score
             dim_counts[pro][dim] += 1
-        for dim, score in record.aggregate.mean_con.items():
+        for dim, score in mean_con.items():
             dim_sums[con][dim] += score
             dim_counts[con][dim] += 1
 
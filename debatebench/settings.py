@@ -4,6 +4,7 @@ Environment-backed settings loader.
 from __future__ import annotations
 
 import os
+import warnings
 from dataclasses import dataclass
 from typing import Optional
 
@@ -16,6 +17,7 @@ class Settings:
     openrouter_site_url: Optional[str] = None
     openrouter_site_name: Optional[str] = None
     capture_usage_costs: bool = True
+    openrouter_catalog_ttl: float = 3600.0
     s3_bucket: Optional[str] = None
     s3_prefix: Optional[str] = None
     aws_profile: Optional[str] = None
@@ -34,11 +36,22 @@ def load_settings() -> Settings:
             return default
         return str(raw).strip().lower() in {"1", "true", "yes", "on"}
 
+    def _float_env(name: str, default: float) -> float:
+        raw = os.getenv(name)
+        if raw is None or not raw.strip():
+            return default
+        try:
+            return float(raw)
+        except ValueError:
+            warnings.warn(f"Ignoring {name}={raw!r} (expected a number of seconds); using {default:g}.")
+            return default
+
     return Settings(
         openrouter_api_key=os.getenv("OPENROUTER_API_KEY"),
         openrouter_site_url=os.getenv("OPENROUTER_SITE_URL"),
         openrouter_site_name=os.getenv("OPENROUTER_SITE_NAME"),
         capture_usage_costs=_bool_env("OPENROUTER_INCLUDE_USAGE", True),
+        openrouter_catalog_ttl=_float_env("OPENROUTER_CATALOG_TTL", 3600.0),
         s3_bucket=os.getenv("DEBATEBENCH_S3_BUCKET") or os.getenv("S3_BUCKET") or "debatebench-results",
         s3_prefix=os.getenv("DEBATEBENCH_S3_PREFIX") or os.getenv("S3_PREFIX"),
         aws_profile=os.getenv("DEBATEBENCH_AWS_PROFILE") or os.getenv("AWS_PROFILE"),
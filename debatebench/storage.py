@@ -4,13 +4,20 @@ Persistence helpers for DebateBench results.
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterator, List, Tuple
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
 
 from .schema import DebateRecord, RatingsFile
 
+# Serializes straight to UTF-8 bytes (model_dump_json decodes to str, which we'd re-encode).
+_DEBATE_RECORD_JSON = TypeAdapter(DebateRecord)
+
 
 def append_debate_record(path: Path, record: DebateRecord) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -21,20 +28,130 @@ def append_debate_record(path: Path, record: DebateRecord) -> None:
         f.write("\n")
 
 
-def load_debate_records(path: Path) -> List[DebateRecord]:
+class BatchedJsonlWriter:
+    """
+    Append debate records to a JSONL file through one open handle, flushing and
+    fsyncing every ``flush_every`` records or ``flush_interval_s`` seconds.
+    Use as a context manager so pending records are written on shutdown.
+    """
+
+    def __init__(self, path: Path, flush_every: int = 8, flush_interval_s: float = 2.0):
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
+        self._pending: List[bytes] = []
+        self._last_flush = time.monotonic()
+        self._fh = None
+
+    def __enter__(self) -> "BatchedJsonlWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.path.open("ab")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, record: DebateRecord) -> None:
+        self._pending.append(_DEBATE_RECORD_JSON.dump_json(record) + b"\n")
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush_if_due(self) -> None:
+        if self._pending and time.monotonic() - self._last_flush >= self.flush_interval_s:
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending or self._fh is None:
+            return
+        self._fh.write(b"".join(self._pending))
+        self._pending.clear()
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        if self._fh is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._fh.close()
+            self._fh = None
+
+
+class JsonlAppender:
+    """
+    Thread-safe append-only JSONL log for low-volume side records (e.g. failed judge
+    calls). The file is opened on the first append and kept open; each record is one
+    write plus flush, so lines from concurrent workers never interleave.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._fh = None
+
+    def append(self, payload: dict) -> None:
+        line = json.dumps(payload) + "\n"
+        with self._lock:
+            if self._fh is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.path.open("a", encoding="utf-8")
+            self._fh.write(line)
+            self._fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+def stream_debate_records(path: Path) -> Iterator[DebateRecord]:
+    """Yield debate records one at a time without materializing the file."""
     if not path.exists():
-        return []
-    records: List[DebateRecord] = []
-    with path.open("r", encoding="utf-8") as f:
+        return
+    # Bytes go straight to pydantic's Rust JSON parser; no intermediate dict per line.
+    with path.open("rb") as f:
         for line in f:
             if not line.strip():
                 continue
-            payload = json.loads(line)
             try:
-                records.append(DebateRecord(**payload))
+                record = DebateRecord.model_validate_json(line)
             except ValidationError as e:
                 raise ValueError(f"Invalid debate record in {path}: {e}") from e
-    return records
+            yield record
+
+
+def iter_debate_keys(path: Path) -> Iterator[Tuple[str, str, str, Tuple[str, ...]]]:
+    """
+    Yield (topic_id, pro_model_id, con_model_id, judge_ids) per stored debate.
+    Reads only those fields from the raw JSON, skipping full record validation;
+    meant for resume bookkeeping where transcripts are never looked at.
+    """
+    if not path.exists():
+        return
+    with path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                rec = from_json(line)
+                tr = rec["transcript"]
+                yield (
+                    tr["topic"]["id"],
+                    tr["pro_model_id"],
+                    tr["con_model_id"],
+                    tuple(j["judge_id"] for j in rec["judges"]),
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Invalid debate record in {path}: {e}") from e
+
+
+def load_debate_records(path: Path) -> List[DebateRecord]:
+    return list(stream_debate_records(path))
 
 
 def write_ratings(path: Path, ratings: RatingsFile) -> None:
@@ -47,6 +164,4 @@ def write_ratings(path: Path, ratings: RatingsFile) -> None:
 def read_ratings(path: Path) -> RatingsFile:
     if not path.exists():
         raise FileNotFoundError(f"Ratings file not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        payload = json.load(f)
-    return RatingsFile(**payload)
+    return RatingsFile.model_validate_json(path.read_bytes())
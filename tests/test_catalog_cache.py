@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from debatebench import openrouter
+from debatebench.settings import load_settings
+
+
+@pytest.fixture
+def fake_catalog(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_fetch(months, api_key, site_url=None, site_name=None):
+        calls.append(months)
+        return [
+            {"id": "org/a", "created": datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc), "name": "A"},
+            {"id": "org/b", "created": datetime(2025, 4, 2, tzinfo=timezone.utc), "name": "B"},
+        ]
+
+    monkeypatch.setattr(openrouter, "CATALOG_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(openrouter, "fetch_recent_openrouter_models", fake_fetch)
+    return calls
+
+
+def test_catalog_cache_round_trips_created_datetimes(fake_catalog):
+    fresh = openrouter.cached_fetch_recent_openrouter_models(4, "key", ttl_s=60)
+    cached = openrouter.cached_fetch_recent_openrouter_models(4, "key", ttl_s=60)
+    assert fake_catalog == [4]
+    assert cached == fresh
+    assert all(isinstance(e["created"], datetime) for e in cached)
+
+
+def test_catalog_cache_expires_after_ttl(fake_catalog):
+    openrouter.cached_fetch_recent_openrouter_models(4, "key", ttl_s=60)
+    path = openrouter._catalog_cache_path(4, "key")
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+    openrouter.cached_fetch_recent_openrouter_models(4, "key", ttl_s=60)
+    assert fake_catalog == [4, 4]
+    # The refetch rewrote the cache, so the next call is a hit again.
+    openrouter.cached_fetch_recent_openrouter_models(4, "key", ttl_s=60)
+    assert fake_catalog == [4, 4]
+
+
+def test_catalog_cache_refresh_and_zero_ttl_bypass(fake_catalog):
+    openrouter.cached_fetch_recent_openrouter_models(4, "key", ttl_s=60)
+    openrouter.cached_fetch_recent_openrouter_models(4, "key", ttl_s=60, refresh=True)
+    openrouter.cached_fetch_recent_openrouter_models(4, "key", ttl_s=0)
+    assert fake_catalog == [4, 4, 4]
+
+
+def test_malformed_catalog_ttl_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_CATALOG_TTL", "1h")
+    with pytest.warns(UserWarning, match="OPENROUTER_CATALOG_TTL"):
+        settings = load_settings()
+    assert settings.openrouter_catalog_ttl == 3600.0
+
+    monkeypatch.setenv("OPENROUTER_CATALOG_TTL", "90")
+    assert load_settings().openrouter_catalog_ttl == 90.0
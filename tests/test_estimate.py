@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+import requests
+
+from debatebench.cli.run import estimate
+from debatebench.settings import Settings
+
+CATALOG = [
+    {"id": "org/a", "pricing": {"prompt": "0.000001", "completion": "0.000002"}},
+    {"id": "org/b", "pricing": {"prompt": "0.000003", "completion": "0.000004"}},
+    {"id": "org/free", "pricing": {"prompt": "", "completion": "0"}},
+]
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, data=None, etag=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = {"ETag": etag} if etag else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return {"data": self._data}
+
+
+class FakeSession:
+    """Serves queued responses (or raises queued exceptions) and records request headers."""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        result = self.responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    fake = FakeSession()
+    monkeypatch.setattr(estimate, "CATALOG_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(estimate, "get_openrouter_session", lambda: fake)
+    return fake
+
+
+def settings(ttl=3600.0) -> Settings:
+    return Settings(openrouter_api_key="key", openrouter_catalog_ttl=ttl)
+
+
+def age_cache(seconds: float) -> None:
+    path = estimate._pricing_cache_path("key")
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_fetch_pricing_serves_fresh_cache_without_network(session):
+    session.responses.append(FakeResponse(data=CATALOG))
+    first = estimate.fetch_pricing({"org/a"}, settings())
+    # Cached for the whole catalog, so a different model subset is still a hit.
+    second = estimate.fetch_pricing({"org/b", "org/free"}, settings())
+    assert first == {"org/a": (1e-06, 2e-06)}
+    assert second == {"org/b": (3e-06, 4e-06)}
+    assert len(session.requests) == 1
+
+
+def test_fetch_pricing_zero_ttl_bypasses_cache(session):
+    session.responses += [FakeResponse(data=CATALOG), FakeResponse(data=CATALOG)]
+    estimate.fetch_pricing({"org/a"}, settings(ttl=0))
+    assert estimate.fetch_pricing({"org/a"}, settings(ttl=0)) == {"org/a": (1e-06, 2e-06)}
+    assert len(session.requests) == 2
+    assert not estimate._pricing_cache_path("key").exists()
+
+
+def test_fetch_pricing_refresh_forces_fetch(session):
+    updated = [{"id": "org/a", "pricing": {"prompt": "0.00001", "completion": "0.00002"}}]
+    session.responses += [FakeResponse(data=CATALOG), FakeResponse(data=updated)]
+    estimate.fetch_pricing({"org/a"}, settings())
+    assert estimate.fetch_pricing({"org/a"}, settings(), refresh=True) == {"org/a": (1e-05, 2e-05)}
+    assert len(session.requests) == 2
+    # The refreshed prices replaced the cache.
+    assert estimate.fetch_pricing({"org/a"}, settings()) == {"org/a": (1e-05, 2e-05)}
+    assert len(session.requests) == 2
+
+
+def test_fetch_pricing_network_failure_uses_stale_cache(session):
+    session.responses.append(FakeResponse(data=CATALOG))
+    estimate.fetch_pricing({"org/a"}, settings())
+    age_cache(7200)
+    session.responses += [requests.ConnectionError("offline"), FakeResponse(status_code=503)]
+    assert estimate.fetch_pricing({"org/a", "org/b"}, settings()) == {
+        "org/a": (1e-06, 2e-06),
+        "org/b": (3e-06, 4e-06),
+    }
+    assert estimate.fetch_pricing({"org/b"}, settings()) == {"org/b": (3e-06, 4e-06)}
+    assert len(session.requests) == 3
+
+
+def test_fetch_pricing_network_failure_without_cache_is_empty(session):
+    session.responses.append(requests.ConnectionError("offline"))
+    assert estimate.fetch_pricing({"org/a"}, settings()) == {}
+
+
+def test_fetch_pricing_revalidates_stale_cache_with_etag(session):
+    session.responses.append(FakeResponse(data=CATALOG, etag='"v1"'))
+    estimate.fetch_pricing({"org/a"}, settings())
+    assert "If-None-Match" not in session.requests[0]
+
+    age_cache(7200)
+    before = estimate._pricing_cache_path("key").stat().st_mtime
+    session.responses.append(FakeResponse(status_code=304))
+    assert estimate.fetch_pricing({"org/a"}, settings()) == {"org/a": (1e-06, 2e-06)}
+    assert session.requests[1]["If-None-Match"] == '"v1"'
+    # A 304 restarts the TTL, so the next call is served from disk.
+    assert estimate._pricing_cache_path("key").stat().st_mtime > before + 3600
+    estimate.fetch_pricing({"org/a"}, settings())
+    assert len(session.requests) == 2
+
+
+def test_fetch_pricing_changed_catalog_rewrites_cache_and_etag(session):
+    session.responses.append(FakeResponse(data=CATALOG, etag='"v1"'))
+    estimate.fetch_pricing({"org/a"}, settings())
+    age_cache(7200)
+
+    updated = [{"id": "org/a", "pricing": {"prompt": "0.00001", "completion": "0.00002"}}]
+    session.responses.append(FakeResponse(data=updated, etag='"v2"'))
+    assert estimate.fetch_pricing({"org/a"}, settings()) == {"org/a": (1e-05, 2e-05)}
+    assert session.requests[1]["If-None-Match"] == '"v1"'
+
+    prices, etag, age = estimate._read_pricing_cache(estimate._pricing_cache_path("key"))
+    assert prices == {"org/a": (1e-05, 2e-05)}
+    assert etag == '"v2"'
+    assert age < 60
+
+    age_cache(7200)
+    session.responses.append(FakeResponse(status_code=304))
+    estimate.fetch_pricing({"org/a"}, settings())
+    assert session.requests[2]["If-None-Match"] == '"v2"'
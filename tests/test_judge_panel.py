@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from debatebench.judge import run_judge_panel
+from debatebench.models import JudgeAdapter
+from debatebench.schema import JudgeModelConfig, MainConfig, Topic, Transcript
+
+CONFIG = MainConfig(
+    rounds=[{"speaker": "pro", "stage": "opening"}],
+    scoring={"dimensions": [{"id": "x"}, {"id": "y"}]},
+    num_judges=3,
+)
+TRANSCRIPT = Transcript(
+    debate_id="d0",
+    benchmark_version="v0",
+    rubric_version="v0",
+    topic=Topic(id="t0", motion="m0"),
+    pro_model_id="a",
+    con_model_id="b",
+    turns=[],
+)
+
+
+class FakeJudge(JudgeAdapter):
+    """Sleeps `latency` seconds per call, then either fails or returns pro-leaning scores."""
+
+    def __init__(self, judge_id: str, latency: float, fails: bool, calls: list, lock: threading.Lock):
+        super().__init__(JudgeModelConfig(id=judge_id, provider="openrouter", model=f"o/{judge_id}"))
+        self.latency = latency
+        self.fails = fails
+        self.calls = calls
+        self.lock = lock
+
+    def judge(self, prompt, structured=True, dim_ids=None, format_hint=None):
+        with self.lock:
+            self.calls.append(self.config.id)
+        time.sleep(self.latency)
+        if self.fails:
+            raise RuntimeError(f"{self.config.id} unavailable")
+        scores = {"pro": {d: 7 for d in dim_ids}, "con": {d: 4 for d in dim_ids}}
+        return json.dumps({"scores": scores}), {"prompt_tokens": 10, "completion_tokens": 2}
+
+
+def make_judges(spec):
+    calls: list = []
+    lock = threading.Lock()
+    return [FakeJudge(j, latency, fails, calls, lock) for j, latency, fails in spec], calls
+
+
+def test_panel_matches_sequential_order_with_fallbacks():
+    # Candidate order is ja..jf (equal usage, no seed). A sequential pass accepts ja, jc, je:
+    # jb and jd fail, and jf is never needed. Completion order differs (jc, je, then ja).
+    judges, calls = make_judges(
+        [
+            ("ja", 0.3, False),
+            ("jb", 0.0, True),
+            ("jc", 0.0, False),
+            ("jd", 0.05, True),
+            ("je", 0.0, False),
+            ("jf", 0.0, False),
+        ]
+    )
+    usage = {"jf": 0}
+    failures = []
+    hooks = []
+
+    results, aggregate = run_judge_panel(
+        candidate_adapters=list(reversed(judges)),
+        transcript=TRANSCRIPT,
+        config=CONFIG,
+        expected=3,
+        usage=usage,
+        failed_judges_sink=failures.append,
+        progress_hook=lambda done, expected, judge_id: hooks.append((done, expected, judge_id)),
+    )
+
+    assert [r.judge_id for r in results] == ["ja", "jc", "je"]
+    assert aggregate.winner == "pro"
+    # Fallbacks: each failure launches exactly the next candidate, so jf is never called.
+    assert set(calls) == {"ja", "jb", "jc", "jd", "je"}
+    assert sorted(f["judge_id"] for f in failures) == ["jb", "jd"]
+    assert all(set(f) == {"judge_id", "error"} and "usable JSON" in f["error"] for f in failures)
+    assert usage == {"ja": 1, "jc": 1, "je": 1, "jf": 0}
+    assert [h[0] for h in hooks] == [1, 2, 3]
+    assert {h[2] for h in hooks} == {"ja", "jc", "je"}
+
+
+def test_panel_orders_candidates_by_usage():
+    judges, calls = make_judges([("ja", 0.0, False), ("jb", 0.0, False), ("jc", 0.0, False)])
+    usage = {"ja": 2, "jb": 1}
+
+    results, _ = run_judge_panel(judges, TRANSCRIPT, CONFIG, expected=2, usage=usage)
+
+    assert [r.judge_id for r in results] == ["jc", "jb"]
+    assert "ja" not in calls
+    assert usage == {"ja": 2, "jb": 2, "jc": 1}
+
+
+def test_panel_raises_when_candidates_run_out():
+    judges, calls = make_judges([("ja", 0.0, True), ("jb", 0.0, False), ("jc", 0.02, True)])
+    failures = []
+
+    with pytest.raises(RuntimeError, match="Collected 1 of 2 judges"):
+        run_judge_panel(judges, TRANSCRIPT, CONFIG, expected=2, failed_judges_sink=failures.append)
+
+    assert set(calls) == {"ja", "jb", "jc"}
+    assert sorted(f["judge_id"] for f in failures) == ["ja", "jc"]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from debatebench.cli.run.planner import _write_json_array, build_plan
+from debatebench.schema import (
+    AggregatedResult,
+    DebateRecord,
+    DebaterModelConfig,
+    JudgeModelConfig,
+    JudgeResult,
+    JudgeScores,
+    MainConfig,
+    Topic,
+    Transcript,
+)
+from debatebench.storage import load_debate_records
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_record(topic: str, pro: str, con: str, judges=("j0", "j1")) -> DebateRecord:
+    transcript = Transcript(
+        debate_id=f"{topic}-{pro}-{con}",
+        benchmark_version="v0",
+        rubric_version="v0",
+        topic=Topic(id=topic, motion=f"motion {topic}"),
+        pro_model_id=pro,
+        con_model_id=con,
+        turns=[],
+    )
+    judge_results = [
+        JudgeResult(judge_id=j, pro=JudgeScores(scores={"x": 6}), con=JudgeScores(scores={"x": 4}), winner="pro")
+        for j in judges
+    ]
+    return DebateRecord(
+        transcript=transcript,
+        judges=judge_results,
+        aggregate=AggregatedResult(winner="pro", mean_pro={"x": 6.0}, mean_con={"x": 4.0}),
+        created_at=NOW,
+    )
+
+
+def make_setup(tmp_path, *, resume=False, balanced_sides=True, n_topics=2, n_debaters=3):
+    opts = SimpleNamespace(
+        balanced_sides=balanced_sides,
+        swap_sides=False,
+        balanced_judges=True,
+        judges_from_selection=False,
+        resume=resume,
+        dry_run=False,
+        estimate_time=False,
+        max_workers=4,
+        refresh_catalog=False,
+        new_model_id=None,
+    )
+    main_cfg = MainConfig(
+        rounds=[{"speaker": "pro", "stage": "opening"}, {"speaker": "con", "stage": "opening"}],
+        scoring={"dimensions": [{"id": "x"}]},
+        num_judges=2,
+    )
+    run_dir = tmp_path / "run"
+    run_dir.mkdir(exist_ok=True)
+    return SimpleNamespace(
+        options=opts,
+        main_cfg=main_cfg,
+        debater_models=[DebaterModelConfig(id=f"d{i}", provider="openrouter", model=f"o/d{i}") for i in range(n_debaters)],
+        judge_models=[JudgeModelConfig(id=f"j{i}", provider="openrouter", model=f"o/j{i}") for i in range(3)],
+        topics_selected=[Topic(id=f"t{i}", motion=f"m{i}") for i in range(n_topics)],
+        run_tag="tag",
+        debates_path=tmp_path / "debates.jsonl",
+        run_dir=run_dir,
+        viz_dir=tmp_path / "viz",
+        plots_dir=tmp_path / "plots",
+        existing_records=[],
+        incremental_mode=False,
+        settings=None,
+    )
+
+
+def write_lines(path, records, extra=""):
+    with path.open("w", encoding="utf-8") as f:
+        for rec in records:
+            f.write(rec.model_dump_json() + "\n\n")  # blank separator lines are tolerated
+        f.write(extra)
+
+
+RESUME_RECORDS = [
+    make_record("t0", "d0", "d1", judges=("j0", "j1")),
+    make_record("t0", "d0", "d1", judges=("j2", "j1")),
+    make_record("t1", "d2", "d0", judges=("j0",)),
+    make_record("t9", "gone", "d0", judges=("j2",)),
+]
+
+
+def test_resume_counts_match_full_record_load(tmp_path):
+    setup = make_setup(tmp_path, resume=True)
+    write_lines(setup.debates_path, RESUME_RECORDS, extra="\n   \n")
+
+    plan, _ = build_plan(setup, debates_per_pair=2)
+
+    records = load_debate_records(setup.debates_path)
+    expected = Counter(
+        (r.transcript.topic.id, r.transcript.pro_model_id, r.transcript.con_model_id) for r in records
+    )
+    assert Counter(plan.completed_counts) == expected
+    assert plan.existing_completed == len(records) == 4
+
+
+def test_resume_rejects_partial_trailing_line_like_full_load(tmp_path):
+    setup = make_setup(tmp_path, resume=True)
+    partial = RESUME_RECORDS[0].model_dump_json()[:-25]
+    write_lines(setup.debates_path, RESUME_RECORDS[:2], extra=partial)
+
+    with pytest.raises(ValueError, match="Invalid debate record"):
+        load_debate_records(setup.debates_path)
+    with pytest.raises(ValueError, match="Invalid debate record"):
+        build_plan(setup, debates_per_pair=2)
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [{"topic": "t0", "pro": "a", "con": "b", "judges": ["j0", "j1"], "rep": 0}],
+        [
+            {"topic": "t0", "pro": "a", "con": "b", "judges": [], "rep": 0},
+            {"topic": "t1", "pro": "b", "con": "a", "judges": ["<insufficient judges after exclusion>"], "rep": 1},
+            {"nested": {"list": [1, {"k": "v\nw"}], "empty": {}}, "unicode": "caf\u00e9"},
+        ],
+    ],
+)
+def test_write_json_array_matches_json_dump(tmp_path, items):
+    path = tmp_path / "schedule.json"
+    _write_json_array(path, iter(items))
+
+    text = path.read_text(encoding="utf-8")
+    assert json.loads(text) == json.loads(json.dumps(list(items)))
+    assert text == json.dumps(list(items), indent=2)
+
+
+@pytest.mark.parametrize("resume", [False, True])
+@pytest.mark.parametrize("balanced_sides", [True, False])
+@pytest.mark.parametrize("debates_per_pair", [1, 2, 3])
+def test_total_runs_matches_materialized_schedule(tmp_path, resume, balanced_sides, debates_per_pair):
+    setup = make_setup(tmp_path, resume=resume, balanced_sides=balanced_sides)
+    # Includes a key completed more often than debates_per_pair=1 allows, a key that is
+    # only in the grid when sides are balanced (d2 vs d0), and one for a topic/model no
+    # longer selected.
+    write_lines(setup.debates_path, RESUME_RECORDS)
+
+    plan, _ = build_plan(setup, debates_per_pair=debates_per_pair)
+
+    assert plan.total_runs == len(plan.tasks)
+    grid = len(setup.topics_selected) * len(plan.pairs) * debates_per_pair
+    if not resume:
+        assert plan.total_runs == grid
+    else:
+        assert plan.total_runs < grid
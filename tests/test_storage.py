@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from debatebench import storage
+from debatebench.schema import (
+    AggregatedResult,
+    DebateRecord,
+    JudgeResult,
+    JudgeScores,
+    Topic,
+    Transcript,
+    Turn,
+)
+from debatebench.storage import BatchedJsonlWriter, JsonlAppender, append_debate_record
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_record(idx: int, topic="t0", pro="a", con="b", judges=("j0", "j1")) -> DebateRecord:
+    transcript = Transcript(
+        debate_id=f"d{idx}",
+        benchmark_version="v0",
+        rubric_version="v0",
+        topic=Topic(id=topic, motion=f"motion {topic}"),
+        pro_model_id=pro,
+        con_model_id=con,
+        turns=[
+            Turn(index=0, speaker="pro", stage="opening", content="café \"quoted\"\n", created_at=NOW, duration_ms=12.5),
+        ],
+        seed=idx,
+    )
+    judge_results = [
+        JudgeResult(
+            judge_id=j,
+            pro=JudgeScores(scores={"x": 6}),
+            con=JudgeScores(scores={"x": 4}),
+            winner="pro",
+            latency_ms=3.0,
+        )
+        for j in judges
+    ]
+    return DebateRecord(
+        transcript=transcript,
+        judges=judge_results,
+        aggregate=AggregatedResult(winner="pro", mean_pro={"x": 6.0}, mean_con={"x": 4.0}),
+        created_at=NOW,
+        debate_seed=idx,
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def line_count(path) -> int:
+    return len(path.read_bytes().splitlines()) if path.exists() else 0
+
+
+def test_batched_writer_flushes_every_n_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage.time, "monotonic", FakeClock())
+    path = tmp_path / "debates.jsonl"
+    with BatchedJsonlWriter(path, flush_every=3, flush_interval_s=60.0) as writer:
+        writer.write(make_record(0))
+        writer.write(make_record(1))
+        assert line_count(path) == 0
+        writer.write(make_record(2))
+        assert line_count(path) == 3
+        writer.write(make_record(3))
+        assert line_count(path) == 3
+    assert line_count(path) == 4
+
+
+def test_batched_writer_flushes_after_interval(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(storage.time, "monotonic", clock)
+    path = tmp_path / "debates.jsonl"
+    with BatchedJsonlWriter(path, flush_every=100, flush_interval_s=2.0) as writer:
+        writer.write(make_record(0))
+        clock.now += 1.0
+        writer.flush_if_due()
+        assert line_count(path) == 0
+        clock.now += 1.0
+        writer.flush_if_due()
+        assert line_count(path) == 1
+        # An overdue write flushes itself without waiting for flush_every.
+        clock.now += 5.0
+        writer.write(make_record(1))
+        assert line_count(path) == 2
+
+
+def test_batched_writer_flushes_and_closes_when_body_raises(tmp_path):
+    path = tmp_path / "debates.jsonl"
+    writer = BatchedJsonlWriter(path, flush_every=100, flush_interval_s=60.0)
+    with pytest.raises(KeyboardInterrupt):
+        with writer:
+            writer.write(make_record(0))
+            writer.write(make_record(1))
+            raise KeyboardInterrupt
+    assert line_count(path) == 2
+    assert writer._fh is None
+
+
+def test_batched_writer_matches_append_debate_record(tmp_path):
+    records = [make_record(i) for i in range(5)]
+    expected = tmp_path / "expected.jsonl"
+    for rec in records:
+        append_debate_record(expected, rec)
+
+    actual = tmp_path / "actual.jsonl"
+    with BatchedJsonlWriter(actual, flush_every=2) as writer:
+        for rec in records:
+            writer.write(rec)
+
+    assert actual.read_bytes() == expected.read_bytes()
+
+
+def test_jsonl_appender_keeps_concurrent_lines_intact(tmp_path):
+    path = tmp_path / "run" / "failed_judges.jsonl"
+    log = JsonlAppender(path)
+    n_threads, per_thread = 8, 200
+    # Large payloads make a torn or interleaved write show up as invalid JSON.
+    error = "x" * 5000
+    start = threading.Barrier(n_threads)
+
+    def worker(tid: int) -> None:
+        start.wait()
+        for i in range(per_thread):
+            log.append({"thread": tid, "seq": i, "judge_id": f"j{tid}", "error": error})
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(n_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    log.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    payloads = [json.loads(line) for line in lines]
+    assert len(payloads) == n_threads * per_thread
+    assert all(p["error"] == error for p in payloads)
+    for tid in range(n_threads):
+        assert [p["seq"] for p in payloads if p["thread"] == tid] == list(range(per_thread))
+
+
+def test_jsonl_appender_creates_file_lazily_and_reopens(tmp_path):
+    path = tmp_path / "run" / "failed_judges.jsonl"
+    log = JsonlAppender(path)
+    log.close()
+    assert not path.exists()
+
+    log.append({"judge_id": "j0"})
+    log.close()
+    log.append({"judge_id": "j1"})
+    log.close()
+    assert [json.loads(line)["judge_id"] for line in path.read_text().splitlines()] == ["j0", "j1"]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from debatebench.cli.summarize import summarize
+from debatebench.schema import (
+    AggregatedResult,
+    DebateRecord,
+    JudgeResult,
+    JudgeScores,
+    Topic,
+    Transcript,
+)
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_record(debate_id, pro, con, mean_pro, mean_con, judges, winner="pro"):
+    transcript = Transcript(
+        debate_id=debate_id,
+        benchmark_version="v0",
+        rubric_version="v0",
+        topic=Topic(id="t0", motion="m0"),
+        pro_model_id=pro,
+        con_model_id=con,
+        turns=[],
+    )
+    judge_results = [
+        JudgeResult(
+            judge_id=judge_id,
+            pro=JudgeScores(scores={"reasoning": 5}),
+            con=JudgeScores(scores={"reasoning": 5}),
+            winner=verdict,
+        )
+        for judge_id, verdict in judges
+    ]
+    return DebateRecord(
+        transcript=transcript,
+        judges=judge_results,
+        aggregate=AggregatedResult(winner=winner, mean_pro=mean_pro, mean_con=mean_con),
+        created_at=NOW,
+    )
+
+
+def write_records(path, records):
+    with path.open("w", encoding="utf-8") as f:
+        for rec in records:
+            f.write(rec.model_dump_json() + "\n")
+
+
+def test_model_dimension_avg_keeps_rubric_order(tmp_path):
+    # Rubric order is reasoning, clarity (not alphabetical).
+    records = [
+        make_record("d1", "zeta", "alpha", {"reasoning": 7.0, "clarity": 6.0}, {"reasoning": 5.0, "clarity": 4.0}, []),
+        make_record("d2", "alpha", "zeta", {"reasoning": 8.0, "clarity": 3.0}, {"reasoning": 6.5, "clarity": 9.0}, []),
+    ]
+    debates = tmp_path / "debates.jsonl"
+    write_records(debates, records)
+
+    summarize(debates_path=debates, out_dir=tmp_path / "viz")
+
+    text = (tmp_path / "viz" / "model_dimension_avg.csv").read_bytes().decode("utf-8")
+    assert text == (
+        "model_id,dimension,mean_score,samples\r\n"
+        "alpha,reasoning,6.5000,2\r\n"
+        "alpha,clarity,3.5000,2\r\n"
+        "zeta,reasoning,6.7500,2\r\n"
+        "zeta,clarity,7.5000,2\r\n"
+    )
+
+
+def test_judge_agreement_uses_canonical_pairs(tmp_path):
+    # Panels list judges in different orders; (b, a) must fold into the (a, b) row.
+    records = [
+        make_record("d1", "p", "c", {}, {}, [("jb", "pro"), ("ja", "pro"), ("jc", "con")]),
+        make_record("d2", "p", "c", {}, {}, [("ja", "con"), ("jc", "con"), ("jb", "pro")]),
+        make_record("d3", "p", "c", {}, {}, [("jc", "tie"), ("jb", "tie")]),
+    ]
+    debates = tmp_path / "debates.jsonl"
+    write_records(debates, records)
+
+    summarize(debates_path=debates, out_dir=tmp_path / "viz")
+
+    text = (tmp_path / "viz" / "judge_agreement.csv").read_bytes().decode("utf-8")
+    assert text == (
+        "judge_a,judge_b,agree,total,agreement_rate\r\n"
+        "ja,jb,1,2,0.5000\r\n"
+        "ja,jc,1,2,0.5000\r\n"
+        "jb,jc,1,3,0.3333\r\n"
+    )